@@ -33,10 +33,12 @@ import bpy
 import sys
 ORIGINAL_MODULES = list(sys.modules)
 
-from json import dump
+from json import dump, dumps, load
+from hashlib import sha1
+from time import perf_counter
 from os import path, makedirs, listdir
 from shutil import rmtree
-from inspect import getmembers, isclass
+from inspect import isclass
 from logging import warning, info, exception
 import webbrowser
 from urllib.parse import urlencode
@@ -44,18 +46,21 @@ from urllib.parse import urlencode
 from network.replicable import Replicable
 
 # Submodules
-from .utilities import if_not_busy, copy_logic_properties_to_collection
+from .utilities import if_not_busy, copy_logic_properties_to_collection, ConditionalHandler
 from .version_checker import RemoteVersionChecker
 from .property_groups import *
 from .configuration import *
 from .operators import *
 from .renderers import *
-from .utilities import type_to_enum_type, get_active_item, load_template
+from .utilities import get_active_item, get_template_defaults
 
 
 active_network_scene = None
 outdated_modules = []
-files_last_modified = {}
+
+# Contents of required text files by filename, with their modification time
+text_file_cache = {}
+text_files_stamp = None
 
 version_checker = RemoteVersionChecker()
 version_checker.start()
@@ -118,6 +123,39 @@ class SystemPanel(bpy.types.Panel):
         bpy.types.Scene.metric_interval = bpy.props.FloatProperty(name="Metrics Sample Interval", default=2.0,
                                                                   description="Time (in seconds) between successive "
                                                                               "network metrics updates")
+        bpy.types.Scene.sync_at_tick_rate = bpy.props.BoolProperty(name="Sync Properties At Tick Rate",
+                                                                   default=False,
+                                                                   description="Only read replicated game properties "
+                                                                               "when a network update is sent")
+        bpy.types.Scene.relevance_radius = bpy.props.FloatProperty(name="Player Cull Radius", default=0.0, min=0.0,
+                                                                   description="Actors farther than this from every "
+                                                                               "controlled pawn are not replicated "
+                                                                               "to any client (0 to disable)")
+        bpy.types.Scene.interest_cell_size = bpy.props.FloatProperty(name="Interest Cell Size", default=0.0, min=0.0,
+                                                                     description="Width of cells used to find "
+                                                                                 "actors near players (0 to use "
+                                                                                 "player cull radius)")
+        bpy.types.Scene.bandwidth_budget = bpy.props.IntProperty(name="Bandwidth Budget", default=0, min=0,
+                                                                 description="Target send rate per connection "
+                                                                             "(bytes per second), above which low "
+                                                                             "priority attributes are throttled "
+                                                                             "(0 to disable)")
+        bpy.types.Scene.metrics_history = bpy.props.IntProperty(name="Metrics History", default=256, min=1,
+                                                                description="Number of network metrics samples "
+                                                                            "retained in memory")
+        bpy.types.Scene.metrics_output = bpy.props.EnumProperty(name="Metrics Output", items=METRICS_OUTPUT_ENUMS,
+                                                                description="File format to which network metrics "
+                                                                            "samples are written")
+        bpy.types.Scene.metrics_file = bpy.props.StringProperty(name="Metrics File", default="",
+                                                                description="Path of network metrics file, relative "
+                                                                            "to blend file (empty for default)")
+        bpy.types.Scene.export_headless_scenes = bpy.props.BoolProperty(name="Export Headless Scenes", default=False,
+                                                                        description="Write scene objects when "
+                                                                                    "saving, to run a headless "
+                                                                                    "server")
+        bpy.types.Scene.threaded_network_io = bpy.props.BoolProperty(name="Threaded Network I/O", default=False,
+                                                                     description="Read and write network packets "
+                                                                                 "on worker threads")
         bpy.types.Scene.use_network = bpy.props.BoolProperty(name="Use Networking", default=False,
                                                              description="Set current scene as root network scene",
                                                              update=on_scene_use_network_updated)
@@ -135,6 +173,22 @@ class SystemPanel(bpy.types.Panel):
 
         layout.prop(scene, "tick_rate")
         layout.prop(scene, "metric_interval")
+        layout.prop(scene, "metrics_history")
+        layout.prop(scene, "metrics_output")
+
+        row = layout.row()
+        row.active = scene.metrics_output != "NONE"
+        row.prop(scene, "metrics_file")
+
+        layout.prop(scene, "sync_at_tick_rate")
+        layout.prop(scene, "threaded_network_io")
+        layout.prop(scene, "export_headless_scenes")
+        layout.prop(scene, "bandwidth_budget")
+        layout.prop(scene, "relevance_radius")
+
+        row = layout.row()
+        row.active = scene.relevance_radius > 0
+        row.prop(scene, "interest_cell_size")
 
         layout.operator("network.select_all", icon='GROUP', text="Select Only Network Objects")
 
@@ -188,6 +242,14 @@ class RPCPanel(NetworkObjectPanelMixin, bpy.types.Panel):
         rpc_args.template_list('RENDER_RT_RPCArgumentList', "RPCProperties", active_rpc, "arguments", active_rpc,
                                "arguments_index", rows=3)
 
+        active_argument = get_active_item(active_rpc.arguments, active_rpc.arguments_index)
+        if active_argument is None or active_argument.type != "FLOAT":
+            return
+
+        column = layout.column()
+        column.active = active_argument.replicate
+        draw_quantisation_settings(column, active_argument)
+
 
 class StatesPanel(NetworkObjectPanelMixin, bpy.types.Panel):
     bl_space_type = "LOGIC_EDITOR"
@@ -310,6 +372,20 @@ class AttributesPanel(NetworkObjectPanelMixin, bpy.types.Panel):
 
         layout.template_list('RENDER_RT_AttributeList', "Properties", obj, "attributes", obj, "attribute_index", rows=3)
 
+        active_attribute = get_active_item(obj.attributes, obj.attribute_index)
+        if active_attribute is None:
+            return
+
+        column = layout.column()
+        column.active = active_attribute.replicate and active_attribute.replicate_after_initial
+        column.prop(active_attribute, "priority")
+        column.prop(active_attribute, "update_interval")
+
+        if active_attribute.type == "FLOAT":
+            column = layout.column()
+            column.active = active_attribute.replicate
+            draw_quantisation_settings(column, active_attribute)
+
 
 class TemplatesPanel(NetworkObjectPanelMixin, bpy.types.Panel):
     bl_space_type = "LOGIC_EDITOR"
@@ -379,74 +455,198 @@ class NetworkPanel(bpy.types.Panel):
         layout.prop(obj, "remote_role", icon='KEYINGSET')
 
 
+def draw_quantisation_settings(layout, group):
+    """Draw quantisation settings of an attribute or RPC argument
+
+    :param layout: UI layout
+    :param group: AttributeGroup or RPCArgumentGroup instance
+    """
+    layout.prop(group, "quantisation")
+
+    if group.quantisation == "FIXED":
+        row = layout.row(align=True)
+        row.prop(group, "quantise_min", text="Min")
+        row.prop(group, "quantise_max", text="Max")
+        layout.prop(group, "quantise_precision")
+
+
+def get_quantisation_data(group):
+    """Return quantisation data of an attribute or RPC argument, or None if not quantised
+
+    :param group: AttributeGroup or RPCArgumentGroup instance
+    """
+    if group.type != "FLOAT" or group.quantisation == "NONE":
+        return None
+
+    return {'mode': group.quantisation, 'minimum': group.quantise_min, 'maximum': group.quantise_max,
+            'precision': group.quantise_precision}
+
+
+def get_actor_definition(obj):
+    """Return network definition data for a network object
+
+    :param obj: Blender object
+    """
+    data = dict()
+
+    get_property_value = lambda n: obj.game.properties[n].value
+    data['attributes'] = {a.name: {'default': get_property_value(a.name),
+                                   'initial_only': not a.replicate_after_initial,
+                                   'priority': a.priority,
+                                   'update_interval': a.update_interval,
+                                   'quantisation': get_quantisation_data(a),
+                                   'ignore_owner': not a.replicate_for_owner}
+                          for a in obj.attributes if a.replicate}
+
+    data['rpc_calls'] = {r.name: {'arguments': {a.name: a.type for a in r.arguments if a.replicate},
+                                  'quantisation': {a.name: get_quantisation_data(a) for a in r.arguments
+                                                   if a.replicate},
+                                  'target': r.target, 'reliable': r.reliable,
+                                  'simulated': r.simulated} for r in obj.rpc_calls}
+
+    base_import_path = obj.template.import_path
+    if not base_import_path:
+        base_import_path = None
+
+    data['template'] = base_import_path
+    data['defaults'] = {d.name: getattr(d, d.value_name) for d in obj.template.defaults}
+    data['states'] = {c.netmode: {'states': list(c.states), 'simulated_states': list(c.simulated_states)}
+                      for c in obj.states}
+    data['remote_role'] = obj.remote_role
+
+    return data
+
+
+def get_scene_definition(scene):
+    """Return object data of a scene, used to load the scene without the BGE (headless server)
+
+    :param scene: Blender scene
+    """
+    objects = []
+
+    for obj in scene.objects:
+        matrix = obj.matrix_world
+        is_active = any(a and b for a, b in zip(obj.layers, scene.layers))
+
+        objects.append({'name': obj.name, 'type': obj.type, 'active': is_active,
+                        'parent': obj.parent.name if obj.parent is not None else None,
+                        'position': list(matrix.to_translation()),
+                        'orientation': [list(row) for row in matrix.to_3x3().normalized()],
+                        'scale': list(matrix.to_scale()),
+                        'properties': {p.name: p.value for p in obj.game.properties}})
+
+    camera = scene.camera
+    return {'objects': objects, 'camera': camera.name if camera is not None else None}
+
+
+def load_manifest(root_data_path):
+    """Load hashes of previously written actor definitions, by scene and object name"""
+    try:
+        with open(path.join(root_data_path, MANIFEST_FILENAME), "r") as file:
+            return load(file)
+
+    except (FileNotFoundError, ValueError):
+        return {}
+
+
 def save_state(context):
     network_scene = active_network_scene
     if network_scene is None:
         print("No network scene exists, nothing to save...")
         return
 
+    start_time = perf_counter()
+
     root_data_path = bpy.path.abspath("//{}".format(DATA_PATH))
 
+    previous_manifest = load_manifest(root_data_path)
+    manifest = {}
+
+    written_count = 0
+    removed_count = 0
+
     for scene in bpy.data.scenes:
         data_path = path.join(root_data_path, scene.name)
         try:
-            file_names = listdir(data_path)
+            file_names = set(listdir(data_path))
 
         except FileNotFoundError:
             makedirs(data_path, exist_ok=True)
-            file_names = listdir(data_path)
+            file_names = set()
+
+        previous_hashes = previous_manifest.get(scene.name, {})
+        hashes = manifest[scene.name] = {}
+
+        actor_definitions = {}
+        non_network_names = set()
 
         for obj in scene.objects:
             obj_name = obj.name
-            obj_path = path.join(data_path, obj_name)
 
-            # Remove any previous network objects
             if not obj.use_network:
-                if obj_name in file_names:
-                    rmtree(obj_path)
+                non_network_names.add(obj_name)
+                continue
+
+            data = get_actor_definition(obj)
+            data_string = dumps(data, sort_keys=True)
+            data_hash = sha1(data_string.encode()).hexdigest()
+
+            hashes[obj_name] = data_hash
+            actor_definitions[obj_name] = data
 
+            # Only write definitions which have changed
+            if previous_hashes.get(obj_name) == data_hash and obj_name in file_names:
                 continue
 
-            definition_filepath = path.join(obj_path, "actor.definition")
+            definition_directory = path.join(data_path, obj_name)
+            makedirs(definition_directory, exist_ok=True)
 
-            data = dict()
+            with open(path.join(definition_directory, "actor.definition"), "w") as file:
+                file.write(data_string)
 
-            get_property_value = lambda n: obj.game.properties[n].value
-            data['attributes'] = {a.name: {'default': get_property_value(a.name),
-                                           'initial_only': not a.replicate_after_initial,
-                                           'ignore_owner': not a.replicate_for_owner}
-                                  for a in obj.attributes if a.replicate}
+            written_count += 1
 
-            data['rpc_calls'] = {r.name: {'arguments': {a.name: a.type for a in r.arguments if a.replicate},
-                                          'target': r.target, 'reliable': r.reliable,
-                                          'simulated': r.simulated} for r in obj.rpc_calls}
+        # Remove definitions of objects which are no longer networked, or were removed
+        stale_names = (non_network_names | (previous_hashes.keys() - hashes.keys())) & file_names
+        for obj_name in stale_names:
+            rmtree(path.join(data_path, obj_name))
 
-            base_import_path = obj.template.import_path
-            if not base_import_path:
-                base_import_path = None
+        removed_count += len(stale_names)
 
-            data['template'] = base_import_path
-            data['defaults'] = {d.name: getattr(d, d.value_name) for d in obj.template.defaults}
-            data['states'] = {c.netmode: {'states': list(c.states), 'simulated_states': list(c.simulated_states)}
-                              for c in obj.states}
-            data['remote_role'] = obj.remote_role
+        # Scene objects are only required by the headless server
+        if network_scene.export_headless_scenes:
+            with open(path.join(data_path, SCENE_FILENAME), "w") as file:
+                dump(get_scene_definition(scene), file)
 
-            # Make sure we have directory for actor definition
-            definition_directory = path.dirname(definition_filepath)
-            makedirs(definition_directory, exist_ok=True)
+        # Write all definitions to a single file, to be read at once by the game
+        if hashes != previous_hashes or ACTOR_BUNDLE_FILENAME not in file_names:
+            with open(path.join(data_path, ACTOR_BUNDLE_FILENAME), "w") as file:
+                dump(actor_definitions, file)
 
-            with open(definition_filepath, "w") as file:
-                dump(data, file)
+    with open(path.join(root_data_path, MANIFEST_FILENAME), "w") as file:
+        dump(manifest, file)
 
     # Main settings
     main_config = {}
     main_config['port'] = network_scene.port
+    main_config['scene'] = network_scene.name
     main_config['tick_rate'] = network_scene.tick_rate
     main_config['metric_interval'] = network_scene.metric_interval
+    main_config['metrics_history'] = network_scene.metrics_history
+    main_config['metrics_output'] = network_scene.metrics_output
+    main_config['metrics_file'] = network_scene.metrics_file
+    main_config['sync_at_tick_rate'] = network_scene.sync_at_tick_rate
+    main_config['threaded_network_io'] = network_scene.threaded_network_io
+    main_config['bandwidth_budget'] = network_scene.bandwidth_budget
+    main_config['relevance_radius'] = network_scene.relevance_radius
+    main_config['interest_cell_size'] = network_scene.interest_cell_size
 
     with open(path.join(root_data_path, "main.definition"), "w") as file:
         dump(main_config, file)
 
+    info("Saved network state in {:.3f}s: {} definitions written, {} removed"
+         .format(perf_counter() - start_time, written_count, removed_count))
+
 
 def get_addon_folder():
     """Return the folder of the network addon"""
@@ -465,6 +665,26 @@ def attribute_allowed_as_argument(rpc_call, attr):
     return True
 
 
+def get_active_object(context):
+    try:
+        return context.object
+
+    except AttributeError:
+        return None
+
+
+def get_attributes_fingerprint(context):
+    obj = get_active_object(context)
+    if obj is None:
+        return None
+
+    return (obj.as_pointer(),
+            tuple((p.name, p.type) for p in obj.game.properties),
+            tuple((a.name, a.type, a.replicate, a.replicate_for_owner) for a in obj.attributes),
+            tuple((r.name, r.target, tuple((a.name, a.type) for a in r.arguments)) for r in obj.rpc_calls),
+            len(obj.states))
+
+
 def update_attributes(context):
     if not hasattr(context, "object"):
         return
@@ -491,37 +711,75 @@ def update_attributes(context):
         client.states[0] = True
 
 
-def verify_text_files(check_modified=False):
-    """Verify that all required text files are included in Blend
+def get_text_files_stamp():
+    """Return modification times of required text files"""
+    source_dir = get_addon_folder()
+    return tuple(path.getmtime(path.join(source_dir, f)) for f in REQUIRED_FILES)
 
-    :param check_modified: optionally check text files are up to date
+
+def refresh_text_file_cache(check_modified=False):
+    """Read required text files from disk if they are not cached, or have been modified
+
+    :param check_modified: optionally check cached files are up to date
     """
-    for filename in REQUIRED_FILES:
-        source_dir = get_addon_folder()
-        source_path = path.join(source_dir, filename)
+    global text_files_stamp
 
+    if text_files_stamp is not None and not check_modified:
+        return
+
+    stamp = get_text_files_stamp()
+    if stamp == text_files_stamp:
+        return
+
+    source_dir = get_addon_folder()
+
+    for filename, last_modified in zip(REQUIRED_FILES, stamp):
         try:
-            text_block = bpy.data.texts[filename]
+            cached_last_modified, _ = text_file_cache[filename]
 
         except KeyError:
-            text_block = bpy.data.texts.new(filename)
+            pass
 
-            with open(source_path, "r") as file:
-                text_block.from_string(file.read())
+        else:
+            if cached_last_modified == last_modified:
+                continue
 
-            info("Created text block for {} from disk".format(filename))
+        with open(path.join(source_dir, filename), "r") as file:
+            text_file_cache[filename] = last_modified, file.read()
 
-        if check_modified:
-            os_last_modified = path.getmtime(source_path)
-            if files_last_modified.get(filename) == os_last_modified:
-                continue
+        info("Read {} from disk".format(filename))
 
-            with open(source_path, "r") as file:
-                text_block.from_string(file.read())
+    text_files_stamp = stamp
+
+
+def verify_text_files(check_modified=False):
+    """Verify that all required text files are included in Blend
+
+    :param check_modified: optionally check text files are up to date
+    """
+    refresh_text_file_cache(check_modified)
+
+    texts = bpy.data.texts
+
+    for filename in REQUIRED_FILES:
+        _, contents = text_file_cache[filename]
+        text_block = texts.get(filename)
+
+        if text_block is None:
+            text_block = texts.new(filename)
+            text_block.from_string(contents)
+
+            info("Created text block for {}".format(filename))
+
+        elif check_modified and text_block.as_string() != contents:
+            text_block.from_string(contents)
 
             info("Updated {} with latest version from disk".format(filename))
 
-            files_last_modified[filename] = os_last_modified
+
+def get_text_files_fingerprint(context):
+    texts = bpy.data.texts
+    return tuple(f in texts for f in REQUIRED_FILES)
 
 
 def update_text_files(context):
@@ -532,6 +790,12 @@ def reload_text_files(context):
     verify_text_files(check_modified=True)
 
 
+def get_network_logic_fingerprint(context):
+    network_scene = active_network_scene
+    network_scene_pointer = network_scene.as_pointer() if network_scene is not None else None
+    return network_scene_pointer, tuple((s.as_pointer(), s.get("__main__")) for s in bpy.data.scenes)
+
+
 def update_network_logic(context):
     network_scene = active_network_scene
 
@@ -565,6 +829,15 @@ def is_replicable(obj):
     return True
 
 
+def get_templates_fingerprint(context):
+    obj = get_active_object(context)
+    if obj is None:
+        return None
+
+    template = obj.template
+    return obj.as_pointer(), template.import_path, len(template.defaults)
+
+
 def update_templates(context):
     try:
         obj = context.object
@@ -585,27 +858,15 @@ def update_templates(context):
     if defaults:
         return
 
-    cls = load_template(template_path)
-
     # Store the default attribute values
-    defaults = template.defaults
     defaults.clear()
 
     template.defaults_active = 0
 
-    ui_types = int, bool, str, float
-
-    for attribute_name, attribute_value in getmembers(cls):
-        if attribute_name.startswith("_"):
-            continue
-
-        value_type = type(attribute_value)
-        if value_type not in ui_types:
-            continue
-
+    for attribute_name, value_type, attribute_value in get_template_defaults(template_path):
         default = defaults.add()
         default.name = attribute_name
-        default.type = type_to_enum_type(value_type)
+        default.type = value_type
 
         value_name = default.value_name
         setattr(default, value_name, attribute_value)
@@ -693,6 +954,20 @@ def pre_game_save(context):
     save_state(context)
 
 
+def invalidate_update_handlers(context):
+    """Force conditional update handlers to run after a new file is loaded"""
+    for handler in on_update_if_active_handlers:
+        handler.invalidate()
+
+
+def log_update_handler_counts(context):
+    """Log how many scene updates each conditional update handler ran or skipped since the previous game run"""
+    for handler in on_update_if_active_handlers:
+        info("{}: ran {} times, skipped {} times".format(handler.callback.__name__, handler.run_count,
+                                                        handler.skip_count))
+        handler.reset_counts()
+
+
 def run_callbacks(handlers):
     context = bpy.context
     for callback in handlers:
@@ -734,20 +1009,23 @@ def on_game_pre(scene):
 
 
 # Handler dispatchers
-on_update_if_active_handlers.append(update_attributes)
-on_update_if_active_handlers.append(update_network_logic)
-on_update_if_active_handlers.append(update_text_files)
-on_update_if_active_handlers.append(update_templates)
+on_update_if_active_handlers.append(ConditionalHandler(update_attributes, get_attributes_fingerprint))
+on_update_if_active_handlers.append(ConditionalHandler(update_network_logic, get_network_logic_fingerprint))
+on_update_if_active_handlers.append(ConditionalHandler(update_text_files, get_text_files_fingerprint,
+                                                       min_interval=0.5))
+on_update_if_active_handlers.append(ConditionalHandler(update_templates, get_templates_fingerprint))
 
 on_update_global_handlers.append(update_use_network)
 on_update_global_handlers.append(poll_version_checker)
 
+pre_game_if_active_handlers.append(log_update_handler_counts)
 pre_game_if_active_handlers.append(pre_game_save)
 pre_game_if_active_handlers.append(clean_modules)
 pre_game_if_active_handlers.append(reload_text_files)
 
 on_save_if_active_handlers.append(save_state)
 on_load_global_handlers.append(set_network_global_var)
+on_load_global_handlers.append(invalidate_update_handlers)
 
 
 registered = False
@@ -3,6 +3,7 @@ from network.enums import Netmodes, Roles
 from network.network import NetworkManager
 from network.replicable import Replicable
 from network.replication import Serialisable
+from network.type_serialisers import TypeInfo
 
 from game_system.entity import MeshComponent
 from game_system.fixed_timestep import FixedTimeStepManager, ForcedLoopExit
@@ -13,18 +14,34 @@ from bge_game_system.world import World as _World
 from bge_game_system.scene import Scene as _Scene
 
 from collections import defaultdict, deque
-from functools import partial
-from json import load
-from os import path
+from functools import partial, lru_cache
+from hashlib import sha1
+from importlib.util import MAGIC_NUMBER
+from json import load, dumps
+from marshal import dump as dump_code, load as load_code
+from os import path, makedirs, listdir, remove, replace
 from weakref import ref, WeakKeyDictionary
 
 from bge import logic, types
 from actors import *
 from messages import *
+from metrics import MetricsTimeSeries, PacketCounter, create_metrics_sample, metrics_writers
+from profiler import FrameProfiler
 from rules import Rules
+from tracking import SceneObjectTracker
+from transport import ThreadedSocket
+from quantisers import *
 
 
 DATA_PATH = "network_data"
+CLASS_CACHE_PATH = "__cache__"
+ACTOR_BUNDLE_FILENAME = "actors.definition"
+EXPRESSION_CACHE_SIZE = 256
+
+# Phases of a network step recorded by the frame profiler, in order
+PROFILED_PHASES = "receive", "convert_messages", "next_frame", "update_state", "process_messages", "synchronise", \
+                  "tick", "relevance", "send", "metrics"
+PROFILE_FILENAME = "profile.json"
 
 
 def safe_for_format(value):
@@ -45,19 +62,89 @@ def eval_bpy_type(type_name):
     return dict(STRING=str, INT=int, BOOL=bool, FLOAT=float, TIMER=float)[type_name]
 
 
+class GeneratedClassCache:
+    """On-disk cache of compiled replicable class declarations"""
+
+    # Increment when the generated source changes
+    version = 3
+
+    def __init__(self, directory):
+        self.directory = directory
+
+    @classmethod
+    def get_key(cls, name, actor_definition):
+        """Return cache key for the class generated from an actor definition
+
+        :param name: name of class
+        :param actor_definition: unparsed actor definition
+        """
+        definition_string = dumps(actor_definition, sort_keys=True)
+        key_string = "{}:{!r}:{}:{}".format(cls.version, MAGIC_NUMBER, name, definition_string)
+        return sha1(key_string.encode()).hexdigest()
+
+    def _get_file_path(self, name, key):
+        return path.join(self.directory, "{}-{}.pyc".format(name, key))
+
+    def load(self, name, key):
+        """Return cached code object, or None if no valid entry exists
+
+        :param name: name of class
+        :param key: cache key
+        """
+        try:
+            with open(self._get_file_path(name, key), "rb") as file:
+                return load_code(file)
+
+        except (OSError, EOFError, ValueError, TypeError):
+            return None
+
+    def store(self, name, key, code):
+        """Write code object to cache, removing outdated entries for this class
+
+        :param name: name of class
+        :param key: cache key
+        :param code: compiled class declaration
+        """
+        try:
+            makedirs(self.directory, exist_ok=True)
+
+            prefix = "{}-".format(name)
+            for file_name in listdir(self.directory):
+                if file_name.startswith(prefix):
+                    remove(path.join(self.directory, file_name))
+
+            file_path = self._get_file_path(name, key)
+            temporary_path = file_path + ".tmp"
+
+            with open(temporary_path, "wb") as file:
+                dump_code(code, file)
+
+            replace(temporary_path, file_path)
+
+        except OSError as err:
+            print("Unable to cache class {}: {}".format(name, err))
+
+
 class ReplicableFactory:
 
+    # Print generated class declarations
+    debug = False
+
     @classmethod
-    def create_rpc_string(cls, name, data):
+    def create_rpc_string(cls, name, data, quantisers=None):
         """Construct RPC call from configuration data
 
         :param name: name of RPC call
         :param data: configuration data
+        :param quantisers: optional mapping from argument name to quantiser
         """
         arguments = data['arguments']
         argument_names = sorted(arguments)
+        if quantisers is None:
+            quantisers = {}
 
-        annotated_arguments = ["{}: {}".format(k, arguments[k].__name__) for k in argument_names]
+        annotated_arguments = ["{}: {}".format(k, cls.create_argument_annotation(arguments[k], quantisers.get(k)))
+                               for k in argument_names]
         argument_declarations = ", {}".format(','.join(annotated_arguments)) if argument_names else ""
         arguments = "({}{})".format(','.join(argument_names), ',' if argument_names else '')
 
@@ -84,6 +171,35 @@ def {name}(self{args}) -> {returns}:
         return func_body.format(decorators=decorators, name=name, args=argument_declarations, returns=return_target,
                                 all_args=arguments)
 
+    @classmethod
+    def create_argument_annotation(cls, argument_type, quantiser=None):
+        """Construct RPC argument annotation
+
+        :param argument_type: type of argument
+        :param quantiser: optional quantiser of argument
+        """
+        if quantiser is None:
+            return argument_type.__name__
+
+        return "TypeInfo(int, max_value={})".format(quantiser.max_value)
+
+    @classmethod
+    def create_quantisers_string(cls, attribute_quantisers, rpc_quantisers):
+        """Construct quantiser lookups of attributes and RPC arguments
+
+        :param attribute_quantisers: mapping from attribute name to quantiser
+        :param rpc_quantisers: mapping from RPC name to mapping of argument name to quantiser
+        """
+        lines = []
+
+        if attribute_quantisers:
+            lines.append("attribute_quantisers = {!r}".format(attribute_quantisers))
+
+        if rpc_quantisers:
+            lines.append("rpc_quantisers = {!r}".format(rpc_quantisers))
+
+        return "\n".join(lines)
+
     @classmethod
     def create_property_synchronisation(cls, attributes):
         names_str = "{}{}".format(','.join(["'{}'".format(x) for x in attributes]), ',' if attributes else '')
@@ -105,6 +221,14 @@ def {name}(self{args}) -> {returns}:
             if data['ignore_owner']:
                 conditions.append("not is_owner")
 
+            # Throttled attributes are checked last, as checking marks them as sent
+            priority = data.get('priority', MAX_ATTRIBUTE_PRIORITY)
+            interval = data.get('update_interval', 0.0)
+
+            if not data['initial_only'] and (priority < MAX_ATTRIBUTE_PRIORITY or interval > 0.0):
+                conditions.append("(is_initial or self.is_attribute_due('{}', {!r}, {!r}))"
+                                  .format(attr_name, interval, priority))
+
             conditions_key = tuple(conditions)
             yield_by_conditions[conditions_key].append(attr_name)
 
@@ -124,8 +248,13 @@ def {name}(self{args}) -> {returns}:
                """    yield from super().can_replicate(is_owner, is_initial)\n    {}""".format(yield_body)
 
     @classmethod
-    def create_attribute_string(cls, name, data, is_raw=False):
+    def create_attribute_string(cls, name, data, is_raw=False, quantiser=None):
         default = data['default']
+
+        if quantiser is not None:
+            return "{} = Serialisable({!r}, max_value={}, notify_on_replicated=True)"\
+                .format(name, quantiser.encode(default), quantiser.max_value)
+
         if not is_raw:
             default = safe_for_format(default)
 
@@ -150,22 +279,28 @@ def {name}(self{args}) -> {returns}:
         return new_cls
 
     @classmethod
-    def from_configuration(cls, raw_name, configuration):
-        """Construct class from definition file
+    def create_class_declaration(cls, name, raw_name, base_name, configuration):
+        """Construct class source from definition file
 
         :param name: name of class
+        :param raw_name: name of game object
+        :param base_name: name of base class
         :param configuration: configuration data
         """
-        name = raw_name.replace(".", "_")
-        assert name.isidentifier()
-
         class_lines = ["mesh = MeshComponent('{}')".format(raw_name)]
 
         _attributes = configuration['attributes']
         attributes = OrderedDict(((k, _attributes[k]) for k in sorted(_attributes)))
 
-        attribute_definitions = [cls.create_attribute_string(attr_name, data) for attr_name, data
-                                 in attributes.items()]
+        attribute_quantisers = {}
+        for attr_name, data in attributes.items():
+            quantiser = create_quantiser(data.get('quantisation'))
+            if quantiser is not None:
+                attribute_quantisers[attr_name] = quantiser
+
+        attribute_definitions = [cls.create_attribute_string(attr_name, data,
+                                                             quantiser=attribute_quantisers.get(attr_name))
+                                 for attr_name, data in attributes.items()]
         # Add remote role
         remote_role = configuration['remote_role']
         roles_data = dict(default="Roles(Roles.authority, {})".format(remote_role), notify=True)
@@ -177,9 +312,21 @@ def {name}(self{args}) -> {returns}:
         _rpc_calls = configuration['rpc_calls']
         rpc_calls = OrderedDict(((k, _rpc_calls[k]) for k in sorted(_rpc_calls)))
 
-        rpc_definitions = [cls.create_rpc_string(function_name, data) for function_name, data in rpc_calls.items()]
+        rpc_quantisers = {}
+        for function_name, data in rpc_calls.items():
+            quantisers = {arg_name: create_quantiser(arg_data)
+                          for arg_name, arg_data in data.get('quantisation', {}).items() if arg_data}
+            if quantisers:
+                rpc_quantisers[function_name] = quantisers
+
+        rpc_definitions = [cls.create_rpc_string(function_name, data, rpc_quantisers.get(function_name))
+                           for function_name, data in rpc_calls.items()]
         class_lines.extend([y for c in rpc_definitions for y in c.split("\n")])
 
+        quantisers_definition = cls.create_quantisers_string(attribute_quantisers, rpc_quantisers)
+        if quantisers_definition:
+            class_lines.extend(quantisers_definition.split("\n"))
+
         conditions_definition = cls.create_conditions_string(attributes)
         class_lines.extend(conditions_definition.split("\n"))
 
@@ -192,6 +339,19 @@ def {name}(self{args}) -> {returns}:
                             for name, value in default_values.items()])
 
         class_body = "\n    ".join(class_lines)
+        return "class {}({}):\n    ".format(name, base_name) + class_body
+
+    @classmethod
+    def from_configuration(cls, raw_name, configuration, class_cache=None, cache_key=None):
+        """Construct class from definition file
+
+        :param raw_name: name of game object
+        :param configuration: configuration data
+        :param class_cache: optional GeneratedClassCache instance
+        :param cache_key: key of definition in class cache
+        """
+        name = raw_name.replace(".", "_")
+        assert name.isidentifier()
 
         base_class_import_path = configuration['template']
         if base_class_import_path is None:
@@ -202,10 +362,21 @@ def {name}(self{args}) -> {returns}:
             base_name = base_class.__name__
             namespace = {base_name: base_class}
 
-        class_declaration = "class {}({}):\n    ".format(name, base_name) + class_body
+        use_cache = class_cache is not None and cache_key is not None
+        code = class_cache.load(name, cache_key) if use_cache else None
+
+        if code is None:
+            class_declaration = cls.create_class_declaration(name, raw_name, base_name, configuration)
 
-        print(class_declaration)
-        exec(class_declaration, globals(), namespace)
+            if cls.debug:
+                print(class_declaration)
+
+            code = compile(class_declaration, "<{}>".format(name), "exec")
+
+            if use_cache:
+                class_cache.store(name, cache_key, code)
+
+        exec(code, globals(), namespace)
         return namespace[name]
 
 
@@ -311,6 +482,9 @@ class Scene(_Scene):
         super().__init__(world, name)
 
         self.entity_classes = {}
+        self.handle = world.scene_registry.add_scene(self)
+        self.object_tracker = SceneObjectTracker(self.bge_scene)
+        self.property_synchroniser = PropertySynchroniser()
 
         if world.netmode == Netmodes.server:
             self.controller_manager = ControllerManager(self)
@@ -352,11 +526,11 @@ class Scene(_Scene):
 
             return encode_scene_info(request, self)
 
-        convert_object_message_logic(get_sensors(obj), message_prefixes_scene, get_subject)
+        convert_object_message_logic(get_sensors(obj), prefix_index_scene, get_subject)
 
         # Convert actuators
         get_subject = lambda identifier, request: encode_object(encode_scene_info(request, self), obj)
-        convert_object_message_logic(get_actuators(obj), message_prefixes_scene, get_subject)
+        convert_object_message_logic(get_actuators(obj), prefix_index_scene, get_subject)
 
     def receive_identified_message(self, identifier, subject):
         """Send message to a specific instance that won't be picked up as a broadcast
@@ -368,17 +542,31 @@ class Scene(_Scene):
         encoded_subject = encode_subject(identifier, encoded_scene_info)
         logic.sendMessage(encoded_subject)
 
-    def _load_configuration_files(self):
+    def _get_actor_definitions(self):
+        """Yield name and actor definition of each network object in scene
+
+        Reads the scene bundle if present, otherwise falls back to individual definition files
+        """
         bge_scene = self.bge_scene
         open_json = self.resource_manager.open_json
 
-        sorted_rpc_argument_info = self.entity_builder.sorted_rpc_argument_info
-        entity_configuration_info = self.entity_builder.entity_configuration_info
-        entity_classes = self.entity_classes
+        object_names = {o.name for o in bge_scene.objects}
+        object_names.update(o.name for o in bge_scene.objectsInactive)
+
+        try:
+            actor_definitions = open_json(ACTOR_BUNDLE_FILENAME)
+
+        except FileNotFoundError:
+            pass
+
+        else:
+            for name, actor_definition in actor_definitions.items():
+                if name in object_names:
+                    yield name, actor_definition
 
-        for obj in list(bge_scene.objects) + list(bge_scene.objectsInactive):
-            name = obj.name
+            return
 
+        for name in object_names:
             definition_path = "{}/actor.definition".format(name)
 
             try:
@@ -387,12 +575,25 @@ class Scene(_Scene):
             except FileNotFoundError:
                 continue
 
+            yield name, actor_definition
+
+    def _load_configuration_files(self):
+        sorted_rpc_argument_info = self.entity_builder.sorted_rpc_argument_info
+        entity_configuration_info = self.entity_builder.entity_configuration_info
+        entity_classes = self.entity_classes
+
+        class_cache = GeneratedClassCache(logic.expandPath("//{}/{}".format(DATA_PATH, CLASS_CACHE_PATH)))
+
+        for name, actor_definition in self._get_actor_definitions():
+            # Parsing modifies the definition, so determine key first
+            cache_key = class_cache.get_key(name, actor_definition)
+
             configuration = self._parse_configuration(actor_definition)
             entity_configuration_info[name] = configuration
             sorted_rpc_argument_info[name] = {rpc_name: sorted(data['arguments']) for rpc_name, data in
                                               configuration['rpc_calls'].items()}
 
-            entity_classes[name] = ReplicableFactory.from_configuration(name, configuration)
+            entity_classes[name] = ReplicableFactory.from_configuration(name, configuration, class_cache, cache_key)
 
     @staticmethod
     def _parse_configuration(actor_definition):
@@ -429,13 +630,19 @@ class GameLoop(FixedTimeStepManager):
         self.world = None
 
         self._listeners = {}
-        self._listeners['SET_NETMODE'] = self._on_set_netmode
+        self.add_listener('SET_NETMODE', self._on_set_netmode)
 
         self._messages = []
         self._converted_scenes = set()
+        self.scene_registry = SceneRegistry()
 
         self._pending_replication_managers = deque()
 
+        # Settings which replace those of main.definition
+        self.settings_overrides = {}
+
+        self.profiler = FrameProfiler(PROFILED_PHASES)
+
     def set_netmode(self, netmode):
         # Load configuration
         print("Loading network information from {}".format(DATA_PATH))
@@ -447,40 +654,73 @@ class GameLoop(FixedTimeStepManager):
         with open(main_definition_path, "r") as file:
             world_settings = load(file)
 
+        world_settings.update(self.settings_overrides)
+
         self.network_update_interval = 1 / world_settings['tick_rate']
         self.metric_interval = world_settings['metric_interval']
+        self.sync_at_tick_rate = world_settings.get('sync_at_tick_rate', False)
+        threaded_network_io = world_settings.get('threaded_network_io', False)
+
+        # Keep history of metrics sample windows, optionally written to file
+        metrics_writer_cls = metrics_writers.get(world_settings.get('metrics_output'))
+        if metrics_writer_cls is None:
+            metrics_writer = None
+
+        else:
+            metrics_file_name = world_settings.get('metrics_file') or metrics_writer_cls.default_filename
+            metrics_writer = metrics_writer_cls(logic.expandPath("//{}".format(metrics_file_name)))
+
+        self.metrics_series = MetricsTimeSeries(world_settings.get('metrics_history', 256), metrics_writer)
+        bandwidth_budget = world_settings.get('bandwidth_budget') or None
 
         print("Set netmode", Netmodes[netmode])
         self.world = World(netmode, logic.getLogicTicRate(), file_path)
+        self.world.scene_registry = self.scene_registry
+        self.world.replication_scheduler = ReplicationScheduler(bandwidth_budget, self.network_update_interval)
         logic.world = self.world
 
         if netmode == Netmodes.server:
             port = world_settings['port']
-            self.world.rules = Rules()
+            self.world.rules = Rules(relevance_radius=world_settings.get('relevance_radius') or None,
+                                     interest_cell_size=world_settings.get('interest_cell_size') or None)
 
         else:
             port = 0
 
         self.network_manager = NetworkManager(self.world, "", port)
 
+        # Socket reads and writes are performed by worker threads, receive() and send() only exchange queued packets
+        if threaded_network_io:
+            self.network_transport = ThreadedSocket(self.network_manager.socket)
+            self.network_manager.socket = self.network_transport
+
+        else:
+            self.network_transport = None
+
+        # Count packets exchanged with the (possibly threaded) socket, for metrics samples
+        self.packet_counter = PacketCounter(self.network_manager.socket)
+        self.network_manager.socket = self.packet_counter
+
         # Time since last sent
         self.time_since_sent = 0.0
 
         # Set network as active update function
         self.on_step = self.step_network
-        self.cleanup = lambda: self.network_manager.stop()
+        self.cleanup = self._stop_network
+
+        self.add_listener('METHOD_INVOKE', self._on_invoke_method)
+        self.add_listener('RPC_INVOKE', self._on_invoke_rpc)
+        self.add_listener('PAWN_REASSOCIATE', self._on_controller_reassign)
+        self.add_listener('SELF_MESSAGE', self._on_self_message)
 
-        self._listeners['METHOD_INVOKE'] = self._on_invoke_method
-        self._listeners['RPC_INVOKE'] = self._on_invoke_rpc
-        self._listeners['PAWN_REASSOCIATE'] = self._on_controller_reassign
-        self._listeners['SELF_MESSAGE'] = self._on_self_message
+        self.add_listener('PROFILER', self._on_profiler_message)
 
-        self._listeners['SCENE_MESSAGE'] = self._on_scene_message
-        self._listeners['PAWN_ASSOCIATE'] = self._on_controller_assign
-        self._listeners['TO_NEW_PAWN'] = self._on_new_pawn_message
+        self.add_listener('SCENE_MESSAGE', self._on_scene_message)
+        self.add_listener('PAWN_ASSOCIATE', self._on_controller_assign)
+        self.add_listener('TO_NEW_PAWN', self._on_new_pawn_message)
 
         if netmode == Netmodes.client:
-            self._listeners['CONNECT_TO'] = self._on_connect_to
+            self.add_listener('CONNECT_TO', self._on_connect_to)
 
         # Set network state
         self._update_network_state()
@@ -489,8 +729,20 @@ class GameLoop(FixedTimeStepManager):
 
         print("Network started")
 
-    def add_listener(self, name, func):
-        self._listeners[name].append(func)
+    def _stop_network(self):
+        self.network_manager.stop()
+        self.metrics_series.close()
+
+        if self.network_transport is not None:
+            self.network_transport.stop()
+
+    def add_listener(self, identifier, func):
+        """Set listener for messages with a given identifier
+
+        :param identifier: message identifier
+        :param func: callback, whose arguments are determined by the message category
+        """
+        self._listeners[identifier] = message_categories[identifier], func
 
     def push_network_message(self, message):
         self._messages.append(message)
@@ -505,12 +757,11 @@ class GameLoop(FixedTimeStepManager):
         print("APPEND NEW MANAGER")
 
     def _process_messages(self):
-        # TODO pre-extract prefixes in SCENE/replicable setup
         messages = self._messages[:]
         self._messages.clear()
 
         listeners = self._listeners
-        world = self.world
+        registry = self.scene_registry
 
         # Lower priority
         non_global_messages = []
@@ -522,20 +773,29 @@ class GameLoop(FixedTimeStepManager):
             except ValueError:
                 continue
 
-            listener = listeners[identifier]
+            try:
+                category, listener = listeners[identifier]
+
+            except KeyError:
+                continue
 
-            if identifier in message_prefixes_global:
+            if category is MESSAGE_GLOBAL:
                 listener(subject)
 
-            elif identifier in message_prefixes_scene:
-                encoded_scene_info, obj = decode_object(subject)
-                request, scene = decode_scene_info(world, encoded_scene_info)
+            elif category is MESSAGE_SCENE:
+                try:
+                    encoded_scene_info, obj = decode_object(registry, subject)
+                    request, scene = decode_scene_info(registry, encoded_scene_info)
+
+                except ValueError:
+                    continue
+
                 non_global_messages.append(partial(listener, scene, obj, request))
 
             # Replicable message
             else:
                 try:
-                    request, replicable = decode_replicable_info(world, subject)
+                    request, replicable = decode_replicable_info(registry, subject)
                 except ValueError:
                     continue
 
@@ -546,10 +806,17 @@ class GameLoop(FixedTimeStepManager):
 
     def _convert_game_global_message_logic(self):
         """Convert all global messages in scene"""
-        for scene in logic.getSceneList():
+        bge_scenes = logic.getSceneList()
+        scenes_changed = len(bge_scenes) != len(self.scene_registry.bge_scenes)
+
+        for scene in bge_scenes:
             if not id(scene) in self._converted_scenes:
                 self._convert_scene_global_message_logic(scene)
                 self._converted_scenes.add(id(scene))
+                scenes_changed = True
+
+        if scenes_changed:
+            self.scene_registry.refresh_bge_scenes(bge_scenes)
 
     def _convert_scene_global_message_logic(self, scene):
         """Convert logic bricks which use GLOBAL message API"""
@@ -558,10 +825,10 @@ class GameLoop(FixedTimeStepManager):
 
         for obj in objects:
             # Convert sensors
-            convert_object_message_logic(get_sensors(obj), message_prefixes_global)
+            convert_object_message_logic(get_sensors(obj), prefix_index_global)
 
             # Convert actuators
-            convert_object_message_logic(get_actuators(obj), message_prefixes_global)
+            convert_object_message_logic(get_actuators(obj), prefix_index_global)
 
     def _on_connect_to(self, target):
         ip_address, port = target.split("@")
@@ -573,6 +840,28 @@ class GameLoop(FixedTimeStepManager):
 
         self.network_manager.connect_to(ip_address, port)
 
+    def _on_profiler_message(self, request):
+        """Handle profiler commands: ON, OFF, RESET or DUMP, with optional file path (DUMP=file.csv)"""
+        command, _, argument = request.partition("=")
+        profiler = self.profiler
+
+        if command == "ON":
+            profiler.enabled = True
+
+        elif command == "OFF":
+            profiler.enabled = False
+
+        elif command == "RESET":
+            profiler.reset()
+
+        elif command == "DUMP":
+            file_path = logic.expandPath("//{}".format(argument or PROFILE_FILENAME))
+            profiler.dump(file_path)
+            print("Dumped {} profiled frames to {}".format(len(profiler), file_path))
+
+        else:
+            print("Unknown profiler command {}".format(command))
+
     def _on_set_netmode(self, netmode_name):
         try:
             netmode = getattr(Netmodes, netmode_name)
@@ -636,13 +925,16 @@ class GameLoop(FixedTimeStepManager):
             to_create_dynamic = []
             to_create_static = []
 
-            for obj in bge_scene.objects:
+            added_objects, has_removed_objects = scene.object_tracker.update()
+            inactive_names = scene.object_tracker.inactive_names
+
+            for obj in added_objects:
                 if "_entity" in obj:
                     continue
 
                 obj_name = obj.name
                 if obj_name in scene.entity_classes:
-                    if obj_name in bge_scene.objectsInactive:
+                    if obj_name in inactive_names:
                         to_create_dynamic.append(obj_name)
 
                     else:
@@ -659,7 +951,8 @@ class GameLoop(FixedTimeStepManager):
                 replicable_cls = scene.entity_classes[new_obj_name]
                 scene.add_replicable(replicable_cls)
 
-            scene.cull_invalid_objects()
+            if has_removed_objects:
+                scene.cull_invalid_objects()
 
     @property
     def time_step(self):
@@ -698,37 +991,91 @@ class GameLoop(FixedTimeStepManager):
         self.check_exit()
 
     def step_network(self, delta_time):
+        profiler = self.profiler
+        is_profiling = profiler.enabled
+
+        if is_profiling:
+            profiler.begin_frame()
+
         self.time_since_sent += delta_time
 
         self.network_manager.receive()
 
+        if is_profiling:
+            profiler.mark("receive")
+
         self._convert_game_global_message_logic()
 
+        if is_profiling:
+            profiler.mark("convert_messages")
+
         # Update BGE gameloop
         logic.NextFrame()
 
+        if is_profiling:
+            profiler.mark("next_frame")
+
         self._update_network_state()
 
+        if is_profiling:
+            profiler.mark("update_state")
+
         # Process received messages from logic.NextFrame()
         self._process_messages()
 
-        for scene in self.world.scenes.values():
-            scene.messenger.send("sync_properties")
+        if is_profiling:
+            profiler.mark("process_messages")
+
+        is_full_update = (self.time_since_sent >= self.network_update_interval)
+
+        # Game properties are only read when they will be sent, if requested
+        if is_full_update or not self.sync_at_tick_rate:
+            for scene in self.world.scenes.values():
+                scene.property_synchroniser.synchronise()
+
+        if is_profiling:
+            profiler.mark("synchronise")
 
         self.world.tick()
 
-        # Transmit new state to remote peer
-        is_full_update = (self.time_since_sent >= self.network_update_interval)
+        if is_profiling:
+            profiler.mark("tick")
+
+        rules = getattr(self.world, "rules", None)
+        if rules is not None:
+            # Relevance is only read when replicating, so viewers need not be updated between full updates
+            if is_full_update:
+                rules.update_viewers(self.world)
+
+            # Throttle low priority attributes if over bandwidth budget
+            network_metrics = self.network_manager.metrics
+            self.world.replication_scheduler.update(delta_time, network_metrics.send_rate, rules.connection_count)
 
+        if is_profiling:
+            profiler.mark("relevance")
+
+        # Transmit new state to remote peer
         self.network_manager.send(is_full_update)
 
+        if is_profiling:
+            profiler.mark("send")
+
         if is_full_update:
             self.time_since_sent = 0.0
 
         # Update network metrics
         network_metrics = self.network_manager.metrics
         if network_metrics.sample_age >= self.metric_interval:
+            sample = create_metrics_sample(self.network_manager, self.packet_counter, self.world,
+                                           SCAPlayerPawnController, network_metrics.sample_age)
+            self.metrics_series.record(sample)
+
             network_metrics.reset_sample_window()
+            self.packet_counter.reset()
+
+        if is_profiling:
+            profiler.mark("metrics")
+            profiler.end_frame()
 
         # Check if exit is required
         self.check_exit()
@@ -845,19 +1192,48 @@ def any_positive(cont):
     return False
 
 
+def _get_code_names(code):
+    names = set(code.co_names)
+
+    # Include names used by nested scopes (generator expressions, lambdas)
+    for constant in code.co_consts:
+        if isinstance(constant, type(code)):
+            names.update(_get_code_names(constant))
+
+    return names
+
+
+@lru_cache(maxsize=EXPRESSION_CACHE_SIZE)
+def compile_expression(expression):
+    """Compile expression, returning code and the names it references
+
+    :param expression: Python expression string
+    """
+    code = compile(expression, "<expression>", "eval")
+    return code, tuple(_get_code_names(code))
+
+
 def EXPRESSION(cont, expression):
     if not any_positive(cont):
         return
 
     own = cont.owner
+    sensors = cont.sensors
+
+    code, names = compile_expression(expression)
+
+    # Sensor states take precedence over game properties
+    namespace = {}
+    for name in names:
+        sensor = sensors.get(name)
 
-    properties = {n: own[n] for n in own.getPropertyNames()}
-    sensors = {s.name: s.positive for s in cont.sensors}
+        if sensor is not None:
+            namespace[name] = sensor.positive
 
-    namespace = properties.copy()
-    namespace.update(sensors)
+        elif name in own:
+            namespace[name] = own[name]
 
-    if eval(expression, namespace):
+    if eval(code, namespace):
         for actuator in cont.actuators:
             activate_actuator(cont, actuator)
     else:
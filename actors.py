@@ -1,5 +1,5 @@
 #from game_system.entity import
-from game_system.replicables import PawnController, Pawn
+from game_system.replicables import PlayerPawnController, Pawn
 
 from messages import *
 
@@ -7,9 +7,186 @@ from math import log
 from network.annotations.decorators import simulated
 from network.enums import Netmodes, Roles
 from functools import partial
+from time import perf_counter
 
 
-class SCAPlayerPawnController(PawnController):
+# Marker for properties which have not yet been synchronised
+_UNSYNCED = object()
+
+# Attributes with this priority are never throttled
+MAX_ATTRIBUTE_PRIORITY = 5
+
+
+def get_property_slots(cls):
+    """Return ordered names of synchronised game properties for actor class
+
+    :param cls: SCAActor subclass
+    """
+    try:
+        return cls.__dict__['_property_slots']
+
+    except KeyError:
+        slots = cls._property_slots = tuple(sorted(cls.property_names))
+        return slots
+
+
+def get_synchronisation_slots(cls):
+    """Return index, name and optional quantiser encode function of each synchronised game property
+
+    :param cls: SCAActor subclass
+    """
+    try:
+        return cls.__dict__['_synchronisation_slots']
+
+    except KeyError:
+        quantisers = cls.attribute_quantisers
+        slots = tuple((i, name, quantisers[name].encode if name in quantisers else None)
+                      for i, name in enumerate(get_property_slots(cls)))
+
+        cls._synchronisation_slots = slots
+        return slots
+
+
+class PropertySynchroniser:
+    """Synchronise game properties of authoritative actors with their replicated attributes
+
+    Actors are grouped by class, as each class shares the same property names
+    """
+
+    def __init__(self):
+        self._actors_by_class = {}
+
+        # Counters for the last synchronisation
+        self.duration = 0.0
+        self.synchronised_actors = 0
+        self.changed_properties = 0
+
+    def add_actor(self, actor):
+        cls = actor.__class__
+        if not get_property_slots(cls):
+            return
+
+        try:
+            actors = self._actors_by_class[cls]
+
+        except KeyError:
+            actors = self._actors_by_class[cls] = set()
+
+        actors.add(actor)
+
+    def remove_actor(self, actor):
+        cls = actor.__class__
+
+        try:
+            actors = self._actors_by_class[cls]
+
+        except KeyError:
+            return
+
+        actors.discard(actor)
+
+        if not actors:
+            del self._actors_by_class[cls]
+
+    def update_actor(self, actor):
+        """Add or remove actor according to its local role
+
+        :param actor: SCAActor instance
+        """
+        if actor.roles.local == Roles.authority:
+            self.add_actor(actor)
+
+        else:
+            self.remove_actor(actor)
+
+    def synchronise_actor(self, actor, slots=None):
+        """Write changed game properties of a single actor to its attributes, and return number changed
+
+        :param actor: SCAActor instance
+        :param slots: synchronisation slots of actor class, if already known
+        """
+        if slots is None:
+            slots = get_synchronisation_slots(actor.__class__)
+
+        game_object = actor.game_object
+        synced_values = actor._synced_values
+        changed = 0
+
+        # Only write changed values to avoid replication comparisons
+        for index, attr_name, encode in slots:
+            value = game_object[attr_name]
+
+            if value != synced_values[index]:
+                synced_values[index] = value
+                setattr(actor, attr_name, value if encode is None else encode(value))
+                changed += 1
+
+        return changed
+
+    def synchronise(self):
+        """Write changed game properties of all registered actors to their attributes"""
+        start_time = perf_counter()
+        synchronised_actors = 0
+        changed_properties = 0
+
+        synchronise_actor = self.synchronise_actor
+
+        for cls, actors in self._actors_by_class.items():
+            slots = get_synchronisation_slots(cls)
+
+            for actor in actors:
+                if actor.game_object.invalid:
+                    continue
+
+                changed_properties += synchronise_actor(actor, slots)
+                synchronised_actors += 1
+
+        self.synchronised_actors = synchronised_actors
+        self.changed_properties = changed_properties
+        self.duration = perf_counter() - start_time
+
+
+class ReplicationScheduler:
+    """Determine when replicated attributes are due to be sent, according to their priority and bandwidth use"""
+
+    def __init__(self, bandwidth_budget=None, throttle_interval=0.1):
+        """Initialise scheduler
+
+        :param bandwidth_budget: optional target send rate per connection (bytes per second)
+        :param throttle_interval: additional delay per priority level per unit of overload
+        """
+        self.bandwidth_budget = bandwidth_budget
+        self.throttle_interval = throttle_interval
+
+        self.time = 0.0
+        self.load = 0.0
+
+    def update(self, delta_time, send_rate, connection_count):
+        """Advance scheduler time and measure load
+
+        :param delta_time: time since last update
+        :param send_rate: total send rate (bytes per second)
+        :param connection_count: number of connected peers
+        """
+        self.time += delta_time
+
+        if self.bandwidth_budget:
+            self.load = send_rate / (self.bandwidth_budget * max(connection_count, 1))
+
+    def get_interval(self, interval, priority):
+        """Return minimum time between updates of an attribute under the current load
+
+        :param interval: minimum update interval of attribute
+        :param priority: priority of attribute
+        """
+        overload = self.load - 1.0
+        if overload <= 0.0:
+            return interval
+
+        return interval + (MAX_ATTRIBUTE_PRIORITY - priority) * overload * self.throttle_interval
+
+
+class SCAPlayerPawnController(PlayerPawnController):
     pass
 
 
@@ -18,6 +195,10 @@ class SCAActor(Pawn):
 
     property_names = set()
 
+    # Quantisers of replicated attributes, and of RPC arguments by RPC name
+    attribute_quantisers = {}
+    rpc_quantisers = {}
+
     states = None
     rpc_arguments = None
     game_object = None
@@ -29,10 +210,16 @@ class SCAActor(Pawn):
         """
         self._convert_message_logic()
 
-        scene.messenger.add_subscriber("sync_properties", self.sync_properties)
+        # Last values written to replicated attributes, by index into property_slots
+        self._synced_values = [_UNSYNCED] * len(self.property_slots)
+
+        # Scheduler time at which throttled attributes were last replicated
+        self._attribute_send_times = {}
+
+        scene.property_synchroniser.update_actor(self)
 
     def on_destroyed(self):
-        self.scene.messenger.remove_subscriber("sync_properties", self.sync_properties)
+        self.scene.property_synchroniser.remove_actor(self)
 
         super().on_destroyed()
 
@@ -41,12 +228,24 @@ class SCAActor(Pawn):
 
         if name == "roles":
             self.set_network_states()
+            self.scene.property_synchroniser.update_actor(self)
 
         elif name in self.property_names:
-            self.set_property(name, getattr(self, name))
+            value = getattr(self, name)
+
+            quantiser = self.attribute_quantisers.get(name)
+            if quantiser is not None:
+                value = quantiser.decode(value)
+
+            self.set_property(name, value)
 
         self.receive_identified_message('NOTIFICATION', name)
 
+    @property
+    def property_slots(self):
+        """Ordered names of synchronised game properties"""
+        return get_property_slots(self.__class__)
+
     @property
     def is_alive(self):
         return not self.game_object.invalid
@@ -90,12 +289,12 @@ class SCAActor(Pawn):
             return encode_replicable_info(request, self)
 
         sensors = [s for s in obj.sensors if isinstance(s, types.KX_NetworkMessageSensor)]
-        convert_object_message_logic(sensors, message_prefixes_replicable, get_subject)
+        convert_object_message_logic(sensors, prefix_index_replicable, get_subject)
 
         # Convert actuators
         get_subject = lambda identifier, request: encode_replicable_info(request, self)
         actuators = [c for c in obj.actuators if isinstance(c, types.KX_NetworkMessageActuator)]
-        convert_object_message_logic(actuators, message_prefixes_replicable, get_subject)
+        convert_object_message_logic(actuators, prefix_index_replicable, get_subject)
 
     @simulated
     def set_network_states(self, just_initialised=False):
@@ -144,11 +343,40 @@ class SCAActor(Pawn):
 
         self.game_object.state = state
 
+    def is_attribute_due(self, name, interval, priority):
+        """Return True if throttled attribute may be replicated
+
+        :param name: name of attribute
+        :param interval: minimum update interval of attribute
+        :param priority: priority of attribute
+        """
+        scheduler = self.scene.world.replication_scheduler
+        now = scheduler.time
+
+        try:
+            last_sent = self._attribute_send_times[name]
+
+        except KeyError:
+            pass
+
+        else:
+            # Permit all connections within the same frame
+            if last_sent != now and now - last_sent < scheduler.get_interval(interval, priority):
+                return False
+
+        self._attribute_send_times[name] = now
+        return True
+
     @simulated
     def dispatch_rpc(self, event_name, data):
         arguments = self.rpc_arguments[event_name]
+        quantisers = self.rpc_quantisers.get(event_name, {})
 
         for name_, value in zip(arguments, data):
+            quantiser = quantisers.get(name_)
+            if quantiser is not None:
+                value = quantiser.decode(value)
+
             self.game_object[name_] = value
 
         self.receive_identified_message('RPC_INVOKE', event_name)
@@ -159,6 +387,11 @@ class SCAActor(Pawn):
         rpc_args = self.rpc_arguments[rpc_name]
         rpc_data = [obj[arg_name] for arg_name in rpc_args]
 
+        quantisers = self.rpc_quantisers.get(rpc_name)
+        if quantisers:
+            rpc_data = [quantisers[arg_name].encode(value) if arg_name in quantisers else value
+                        for arg_name, value in zip(rpc_args, rpc_data)]
+
         getattr(self, rpc_name)(*rpc_data)
 
     @simulated
@@ -167,6 +400,4 @@ class SCAActor(Pawn):
             return
 
         if self.roles.local == Roles.authority:
-            get_property = self.get_property
-            for attr_name in self.property_names:
-                setattr(self, attr_name, get_property(attr_name))
+            self.scene.property_synchroniser.synchronise_actor(self)
@@ -0,0 +1,117 @@
+"""Compare the rate at which Python controllers invoke functions through the multiplayer interface module
+
+Python controllers run "multiplayer.NAME" every logic tick. The interface memoises the callable resolved for each name,
+whereas it previously matched regular expressions, copied its globals and executed formatted source on every
+invocation. The previous interface is reproduced here for comparison.
+
+Stand-in bge and _mainloop modules provide the current controller and the controller functions, so that neither
+Blender nor the network library is required. Invocations per second are reported.
+
+Usage: python controller_interface.py [--number N] [--repeat R]
+"""
+from argparse import ArgumentParser
+from os import path
+from timeit import repeat
+from types import ModuleType
+import re
+import sys
+
+sys.path.insert(0, path.dirname(path.dirname(path.abspath(__file__))))
+
+
+def AND(cont):
+    pass
+
+
+def EXPRESSION(cont, expression):
+    pass
+
+
+# Global used by a non-literal controller argument
+CONDITION = "health < 0"
+
+
+def get_current_controller():
+    return None
+
+
+def install_stand_in_modules():
+    """Provide the current controller, and the controller functions which multiplayer imports from _mainloop"""
+    logic = ModuleType("bge.logic")
+    logic.getCurrentController = get_current_controller
+
+    bge = ModuleType("bge")
+    bge.logic = logic
+
+    mainloop = ModuleType("_mainloop")
+    mainloop.AND = AND
+    mainloop.EXPRESSION = EXPRESSION
+    mainloop.CONDITION = CONDITION
+
+    sys.modules.update({"bge": bge, "bge.logic": logic, "_mainloop": mainloop})
+
+
+class ExecInterface:
+    """Previous interface, which resolved and executed the controller source on every invocation"""
+
+    def __init__(self, namespace):
+        self.namespace = namespace
+        self.get_arguments = re.compile('\((.*)\)\Z')
+        self.get_function_name = re.compile('.*?(?=\()')
+
+    def __getattr__(self, name):
+        namespace = self.namespace
+        match = re.search(self.get_function_name, name)
+
+        if match is None:
+            try:
+                return namespace[name]
+
+            except KeyError:
+                raise AttributeError(name)
+
+        function_name = match.group(0)
+        if function_name not in namespace:
+            raise AttributeError(function_name)
+
+        argument_match = re.search(self.get_arguments, name)
+        if argument_match is None:
+            arguments = ""
+
+        else:
+            arguments = argument_match.group(1)
+
+        data = namespace.copy()
+        data["cont"] = get_current_controller()
+
+        return lambda: exec("{}(cont, {})".format(function_name, arguments), data)
+
+
+CONTROLLER_NAMES = "AND()", "EXPRESSION('health < 0')", "EXPRESSION(CONDITION)"
+
+
+def main(argv=None):
+    parser = ArgumentParser(description="Compare controller invocation rates of the multiplayer interface")
+    parser.add_argument("--number", type=int, default=20000, help="invocations per repeat")
+    parser.add_argument("--repeat", type=int, default=5, help="number of repeats, of which the best is reported")
+    args = parser.parse_args(argv)
+
+    install_stand_in_modules()
+    import multiplayer
+
+    interfaces = (("exec", ExecInterface(vars(sys.modules["_mainloop"]))), ("memoised", multiplayer))
+
+    print("interface\tcontroller\tinvocations/s")
+
+    for interface_name, interface in interfaces:
+        for controller_name in CONTROLLER_NAMES:
+            # As the Python controller does, look up the name on each invocation
+            def invoke():
+                getattr(interface, controller_name)()
+
+            best = min(repeat(invoke, number=args.number, repeat=args.repeat))
+            print("{}\t{}\t{:.0f}".format(interface_name, controller_name, args.number / best))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,118 @@
+"""Compare the time taken to find actors near any player with the interest grid, and by testing every distance
+
+Simulates the work of Rules.update_viewers at each full network update: every actor moves and is re-bucketed in the
+grid, then the grid is queried around the pawn of every connection. Actors outside the union of these queries are
+culled for all clients. The brute-force method tests the distance of every actor from every pawn. Both methods must
+find the same actors; the mean time per update is reported in milliseconds.
+
+Usage: python interest_grid.py [--actors 1000,5000,10000] [--connections 8,32,64] [--radius R] [--world-size S]
+                               [--updates N]
+"""
+from argparse import ArgumentParser
+from os import path
+from random import Random
+from time import perf_counter
+import sys
+
+sys.path.insert(0, path.dirname(path.dirname(path.abspath(__file__))))
+
+from interest import InterestGrid
+
+
+class StandInActor:
+    """Actor with a position which wanders on the ground plane"""
+
+    def __init__(self, random, world_size):
+        self.position = random.uniform(0, world_size), random.uniform(0, world_size), 0.0
+
+    def move(self, random, world_size):
+        x, y, z = self.position
+        x = min(max(x + random.uniform(-1.0, 1.0), 0.0), world_size)
+        y = min(max(y + random.uniform(-1.0, 1.0), 0.0), world_size)
+        self.position = x, y, z
+
+
+def find_relevant_with_grid(grid, actors, viewers, radius):
+    for actor in actors:
+        grid.update(actor, actor.position)
+
+    relevant_actors = set()
+    for viewer in viewers:
+        relevant_actors.update(grid.query(viewer.position, radius))
+
+    return relevant_actors
+
+
+def find_relevant_by_distance(actors, viewers, radius):
+    radius_squared = radius * radius
+    relevant_actors = set()
+
+    for viewer in viewers:
+        x, y, z = viewer.position
+
+        for actor in actors:
+            actor_x, actor_y, actor_z = actor.position
+            if (actor_x - x) ** 2 + (actor_y - y) ** 2 + (actor_z - z) ** 2 <= radius_squared:
+                relevant_actors.add(actor)
+
+    return relevant_actors
+
+
+def run_case(actor_count, connection_count, radius, world_size, update_count, seed=0):
+    """Return mean time per update of each method, and mean number of relevant actors
+
+    :param actor_count: number of simulated actors
+    :param connection_count: number of connections, each with a pawn
+    """
+    random = Random(seed)
+
+    actors = [StandInActor(random, world_size) for _ in range(actor_count)]
+    # Pawns are actors too
+    viewers = random.sample(actors, connection_count)
+
+    grid = InterestGrid(radius)
+    grid_time = distance_time = 0.0
+    relevant_count = 0
+
+    for _ in range(update_count):
+        for actor in actors:
+            actor.move(random, world_size)
+
+        start_time = perf_counter()
+        grid_relevant = find_relevant_with_grid(grid, actors, viewers, radius)
+        grid_time += perf_counter() - start_time
+
+        start_time = perf_counter()
+        distance_relevant = find_relevant_by_distance(actors, viewers, radius)
+        distance_time += perf_counter() - start_time
+
+        if grid_relevant != distance_relevant:
+            raise AssertionError("Interest grid found different actors to brute force")
+
+        relevant_count += len(grid_relevant)
+
+    return grid_time / update_count, distance_time / update_count, relevant_count / update_count
+
+
+def main(argv=None):
+    parser = ArgumentParser(description="Compare interest grid and brute-force relevance of actors near players")
+    parser.add_argument("--actors", default="1000,5000,10000", help="comma separated actor counts")
+    parser.add_argument("--connections", default="8,32,64", help="comma separated connection counts")
+    parser.add_argument("--radius", type=float, default=50.0, help="player cull radius")
+    parser.add_argument("--world-size", type=float, default=1000.0, help="width of square world")
+    parser.add_argument("--updates", type=int, default=10, help="full updates simulated per case")
+    args = parser.parse_args(argv)
+
+    print("actors\tconnections\trelevant\tgrid ms\tdistance ms\tspeedup")
+
+    for actor_count in (int(c) for c in args.actors.split(",")):
+        for connection_count in (int(c) for c in args.connections.split(",")):
+            grid_time, distance_time, relevant_count = run_case(actor_count, connection_count, args.radius,
+                                                                args.world_size, args.updates)
+            print("{}\t{}\t{:.0f}\t{:.2f}\t{:.2f}\t{:.1f}x".format(actor_count, connection_count, relevant_count,
+                                                                 grid_time * 1000, distance_time * 1000,
+                                                                 distance_time / grid_time))
+
+
+if __name__ == "__main__":
+    main()
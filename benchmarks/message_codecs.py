@@ -0,0 +1,70 @@
+"""Compare the time taken to encode and decode message subjects with each message codec
+
+Each subject kind (object, replicable and scene) is encoded and decoded in turn, and the best time per message of
+several repeats is reported in microseconds.
+
+Usage: python message_codecs.py [--number N] [--repeat R]
+"""
+from argparse import ArgumentParser
+from os import path
+from timeit import repeat
+import sys
+
+sys.path.insert(0, path.dirname(path.dirname(path.abspath(__file__))))
+
+from messages import CompactMessageCodec, JSONMessageCodec
+
+
+CODECS = (("json", JSONMessageCodec()), ("compact", CompactMessageCodec()))
+
+SUBJECT = "SendPos"
+SCENE_HANDLE = 2
+UNIQUE_ID = 1043
+
+
+class StandInScene:
+    pass
+
+
+class StandInObject:
+    """Game object with the scene attribute read by encode_object"""
+
+    def __init__(self):
+        self.scene = StandInScene()
+
+
+def create_round_trips(codec):
+    """Return mapping from subject kind to function which encodes and decodes a subject of that kind
+
+    :param codec: message codec
+    """
+    obj = StandInObject()
+
+    def object_round_trip():
+        codec.decode_object(codec.encode_object(SUBJECT, obj))
+
+    def replicable_round_trip():
+        codec.decode_replicable_info(codec.encode_replicable_info(SUBJECT, SCENE_HANDLE, UNIQUE_ID))
+
+    def scene_round_trip():
+        codec.decode_scene_info(codec.encode_scene_info(SUBJECT, SCENE_HANDLE))
+
+    return (("object", object_round_trip), ("replicable", replicable_round_trip), ("scene", scene_round_trip))
+
+
+def main(argv=None):
+    parser = ArgumentParser(description="Compare encode and decode times of message codecs")
+    parser.add_argument("--number", type=int, default=100000, help="messages per repeat")
+    parser.add_argument("--repeat", type=int, default=5, help="number of repeats, of which the best is reported")
+    args = parser.parse_args(argv)
+
+    print("codec\tsubject\tus/message")
+
+    for codec_name, codec in CODECS:
+        for kind, round_trip in create_round_trips(codec):
+            best = min(repeat(round_trip, number=args.number, repeat=args.repeat))
+            print("{}\t{}\t{:.2f}".format(codec_name, kind, best / args.number * 1e6))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+"""Compare the bytes per update, accuracy and cost of replicating float values with each quantisation mode
+
+An update of the template's SendPos and SendOri RPCs (three floats each) is packed with struct: full precision values
+as single or double precision floats, and quantised values as the smallest unsigned integer format which holds the
+quantiser's max_value, as integer Serialisables with a max_value are packed by the network library. Packet headers and
+other fields are not included. Values are drawn at random within each quantiser's range; the maximum round trip error
+and the time to encode and decode a value (in microseconds) are also reported.
+
+Usage: python quantisation.py [--samples N]
+"""
+from argparse import ArgumentParser
+from os import path
+from random import Random
+from struct import calcsize, pack, unpack
+from time import perf_counter
+import sys
+
+sys.path.insert(0, path.dirname(path.dirname(path.abspath(__file__))))
+
+from quantisers import FixedPointQuantiser, HalfFloatQuantiser
+
+
+# Values sent per update, SendPos and SendOri each have three arguments
+VALUES_PER_UPDATE = 6
+
+# Range of generated values when not quantised
+FULL_RANGE = -100.0, 100.0
+
+INTEGER_FORMATS = "B", "H", "I", "Q"
+
+
+def get_integer_format(max_value):
+    """Return smallest unsigned struct format which holds max_value"""
+    for format_character in INTEGER_FORMATS:
+        if max_value < 1 << (calcsize(format_character) * 8):
+            return format_character
+
+    raise ValueError("Value too large to pack")
+
+
+class FullPrecision:
+    """Unquantised value, packed as a float"""
+
+    def __init__(self, format_character):
+        self.format_character = "<" + format_character
+
+    def encode(self, value):
+        return value
+
+    def decode(self, value):
+        # Round to the precision of the packed float
+        format_character = self.format_character
+        return unpack(format_character, pack(format_character, value))[0]
+
+
+def create_modes():
+    """Return sequence of mode names, quantisers, struct formats of one value, and ranges of values"""
+    return (("float (d)", FullPrecision("d"), "d", FULL_RANGE),
+            ("float (f)", FullPrecision("f"), "f", FULL_RANGE),
+            ("half", HalfFloatQuantiser(), get_integer_format(HalfFloatQuantiser.max_value), FULL_RANGE),
+            ("fixed -100..100 / 0.01", FixedPointQuantiser(-100.0, 100.0, 0.01), None, (-100.0, 100.0)),
+            ("fixed -1..1 / 0.01", FixedPointQuantiser(-1.0, 1.0, 0.01), None, (-1.0, 1.0)),
+            ("fixed -pi..pi / 0.001", FixedPointQuantiser(-3.1416, 3.1416, 0.001), None, (-3.1416, 3.1416)))
+
+
+def measure_mode(quantiser, format_character, value_range, sample_count, random):
+    """Return bytes per update, maximum round trip error and encode+decode time of one value (in seconds)"""
+    if format_character is None:
+        format_character = get_integer_format(quantiser.max_value)
+
+    values = [random.uniform(*value_range) for _ in range(sample_count)]
+    update_format = "<" + format_character * VALUES_PER_UPDATE
+    update_size = len(pack(update_format, *(quantiser.encode(v) for v in values[:VALUES_PER_UPDATE])))
+
+    start_time = perf_counter()
+    decoded = [quantiser.decode(quantiser.encode(v)) for v in values]
+    duration = (perf_counter() - start_time) / sample_count
+
+    max_error = max(abs(d - v) for d, v in zip(decoded, values))
+
+    return update_size, max_error, duration
+
+
+def main(argv=None):
+    parser = ArgumentParser(description="Compare bytes per update of quantised and full precision floats")
+    parser.add_argument("--samples", type=int, default=100000, help="random values measured per mode")
+    args = parser.parse_args(argv)
+
+    print("mode\tbytes/update\tmax error\tus/value")
+
+    for name, quantiser, format_character, value_range in create_modes():
+        update_size, max_error, duration = measure_mode(quantiser, format_character, value_range, args.samples,
+                                                        Random(0))
+        print("{}\t{}\t{:.3g}\t{:.2f}".format(name, update_size, max_error, duration * 1e6))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,147 @@
+"""Compare the time taken to find new network objects with SceneObjectTracker, and by scanning the whole scene
+
+Synthetic scenes of static props (and a few network objects) stand in for BGE scenes. Three updates are timed for
+the tracker: a steady-state update where nothing changed, an update after objects were added, and the full rescan
+made when the last seen object was removed. The full scan is the previous behaviour of _update_network_state, which
+examined every object and tested its name against the inactive object list. Mean times are reported in
+milliseconds.
+
+Usage: python scene_tracking.py [--objects 1000,10000] [--added 10] [--repeat N]
+"""
+from argparse import ArgumentParser
+from os import path
+from time import perf_counter
+import sys
+
+sys.path.insert(0, path.dirname(path.dirname(path.abspath(__file__))))
+
+from tracking import SceneObjectTracker
+
+
+# Names of inactive objects, which are spawned as network objects
+NETWORK_OBJECT_NAMES = ["Player", "Projectile", "Pickup"]
+
+
+class StandInObject:
+    """Game object supporting the property test made for each new object"""
+
+    def __init__(self, name):
+        self.name = name
+        self.invalid = False
+        self._properties = {}
+
+    def __contains__(self, name):
+        return name in self._properties
+
+
+class StandInObjectList(list):
+    """Object list which, as a CListValue, tests membership by name by searching its objects"""
+
+    def __contains__(self, name):
+        for obj in self:
+            if obj.name == name:
+                return True
+
+        return False
+
+
+class StandInScene:
+
+    def __init__(self, object_count):
+        self.objects = StandInObjectList(StandInObject("Prop.{}".format(i)) for i in range(object_count))
+        self.objectsInactive = StandInObjectList(StandInObject(n) for n in NETWORK_OBJECT_NAMES)
+
+        # Static props make up most of the scene, network classes are known for these names
+        self.entity_classes = {n: None for n in NETWORK_OBJECT_NAMES}
+
+    def add_objects(self, count):
+        for i in range(count):
+            self.objects.append(StandInObject(NETWORK_OBJECT_NAMES[i % len(NETWORK_OBJECT_NAMES)]))
+
+    def remove_last_object(self):
+        self.objects.pop().invalid = True
+
+
+def find_new_network_objects(objects, entity_classes, is_inactive):
+    to_create = []
+
+    for obj in objects:
+        if "_entity" in obj:
+            continue
+
+        obj_name = obj.name
+        if obj_name in entity_classes:
+            to_create.append((obj_name, is_inactive(obj_name)))
+
+    return to_create
+
+
+def full_scan(scene):
+    return find_new_network_objects(scene.objects, scene.entity_classes, scene.objectsInactive.__contains__)
+
+
+def tracked_scan(scene, tracker):
+    added, has_removed = tracker.update()
+    return find_new_network_objects(added, scene.entity_classes, tracker.inactive_names.__contains__)
+
+
+def time_call(function, prepare, repeat):
+    total_time = 0.0
+
+    for _ in range(repeat):
+        prepare()
+
+        start_time = perf_counter()
+        function()
+        total_time += perf_counter() - start_time
+
+    return total_time / repeat
+
+
+def run_case(object_count, added_count, repeat):
+    """Return mean time of each kind of update
+
+    :param object_count: number of objects in scene
+    :param added_count: number of objects added before an update with additions
+    """
+    scene = StandInScene(object_count)
+    tracker = SceneObjectTracker(scene)
+    tracker.update()
+
+    def do_nothing():
+        pass
+
+    def add_objects():
+        scene.add_objects(added_count)
+
+    def remove_last_object():
+        scene.add_objects(1)
+        tracker.update()
+        scene.remove_last_object()
+
+    def update():
+        tracked_scan(scene, tracker)
+
+    return dict(full_scan=time_call(lambda: full_scan(scene), do_nothing, repeat),
+                steady=time_call(update, do_nothing, repeat),
+                added=time_call(update, add_objects, repeat),
+                rescan=time_call(update, remove_last_object, repeat))
+
+
+def main(argv=None):
+    parser = ArgumentParser(description="Compare incremental scene object tracking with full scene scans")
+    parser.add_argument("--objects", default="1000,10000", help="comma separated scene object counts")
+    parser.add_argument("--added", type=int, default=10, help="objects added before each update with additions")
+    parser.add_argument("--repeat", type=int, default=50, help="updates timed for each case")
+    args = parser.parse_args(argv)
+
+    columns = "full_scan", "steady", "added", "rescan"
+    print("objects\t" + "\t".join("{} ms".format(c) for c in columns))
+
+    for object_count in (int(c) for c in args.objects.split(",")):
+        times = run_case(object_count, args.added, args.repeat)
+        print("{}\t".format(object_count) + "\t".join("{:.4f}".format(times[c] * 1000) for c in columns))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+"""Measure the time taken to start a network game, with and without the generated class cache
+
+Each start runs in a new interpreter, in which the headless server loads the root scene, sets the netmode and creates
+the network scene, generating a replicable class for each actor definition. Cold starts remove the class cache
+(network_data/__cache__) first, so that every class is generated and compiled; warm starts load the cached classes.
+
+This uses the stand-in bge package of the headless server, so it requires the same modules as headless/server.py (the
+PyAuthServer libraries and mathutils), but not Blender. Scenes must have been saved with "Export Headless Scenes"
+enabled. Startup within Blender also includes converting logic bricks, which is not measured.
+
+Usage: python startup.py <game directory> [--repeat N] [--port PORT]
+"""
+from argparse import ArgumentParser, SUPPRESS
+from json import dumps, loads
+from os import path
+from shutil import rmtree
+from time import perf_counter
+import subprocess
+import sys
+
+HEADLESS_DIRECTORY = path.join(path.dirname(path.dirname(path.abspath(__file__))), "headless")
+
+DATA_PATH = "network_data"
+CLASS_CACHE_PATH = "__cache__"
+
+
+def measure_start(game_directory, port):
+    """Start server in this interpreter, and return time taken (in seconds) until the network scene is created
+
+    :param game_directory: directory containing network data
+    :param port: port to bind server
+    """
+    start_time = perf_counter()
+
+    sys.path.insert(0, HEADLESS_DIRECTORY)
+    from server import load_headless_game, create_game_loop
+
+    load_headless_game(game_directory)
+
+    game_loop = create_game_loop('server', {'port': port})
+    # Netmode is set, and network scenes are created, in the first step
+    game_loop.on_step(game_loop.time_step)
+
+    duration = perf_counter() - start_time
+
+    class_count = sum(len(scene.entity_classes) for scene in game_loop.world.scenes.values())
+    game_loop.cleanup()
+
+    return {'duration': duration, 'classes': class_count}
+
+
+def run_start(game_directory, port, use_cache):
+    """Start server in a new interpreter, and return its measurements
+
+    :param use_cache: if False, remove class cache first
+    """
+    if not use_cache:
+        rmtree(path.join(game_directory, DATA_PATH, CLASS_CACHE_PATH), ignore_errors=True)
+
+    output = subprocess.check_output([sys.executable, __file__, game_directory, "--port", str(port), "--child"],
+                                     universal_newlines=True)
+
+    # Server prints progress, measurements are written last
+    return loads(output.strip().splitlines()[-1])
+
+
+def main(argv=None):
+    parser = ArgumentParser(description="Measure network game start time with and without the class cache")
+    parser.add_argument("game_directory", help="directory containing the network_data directory")
+    parser.add_argument("--repeat", type=int, default=5, help="starts measured for each mode")
+    parser.add_argument("--port", type=int, default=1200, help="server port")
+    parser.add_argument("--child", action="store_true", help=SUPPRESS)
+    args = parser.parse_args(argv)
+
+    game_directory = path.abspath(args.game_directory)
+
+    if args.child:
+        print(dumps(measure_start(game_directory, args.port)))
+        return
+
+    print("mode\tclasses\tmin s\tmean s")
+
+    for mode, use_cache in (("cold", False), ("warm", True)):
+        # Ensure cache is populated before warm starts
+        if use_cache:
+            run_start(game_directory, args.port, use_cache)
+
+        results = [run_start(game_directory, args.port, use_cache) for _ in range(args.repeat)]
+        durations = [r['duration'] for r in results]
+
+        print("{}\t{}\t{:.3f}\t{:.3f}".format(mode, results[0]['classes'], min(durations),
+                                              sum(durations) / len(durations)))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,104 @@
+"""Compare the time taken to linearise deep template stacks with determine_mro, and with the previous implementation
+
+Template classes are generated as a chain of the given depth, in which each class also mixes in a class from a set of
+shared mixins, and several templates are selected from the top of the chain, as when templates are enabled on an
+object. The previous quadratic implementation is reproduced here for comparison. Both uncached calls (as when the
+selected templates change) and cached calls (as when the UI redraws) are timed, in microseconds.
+
+Usage: python template_mro.py [--depths 10,50,200] [--selected 4] [--number N] [--repeat R]
+"""
+from argparse import ArgumentParser
+from os import path
+from timeit import repeat
+import sys
+
+sys.path.insert(0, path.dirname(path.dirname(path.abspath(__file__))))
+
+from mro import determine_mro
+
+
+MIXIN_COUNT = 8
+
+
+def determine_mro_quadratic(*bases):
+    """Previous implementation of determine_mro, which scanned every sequence tail for each candidate"""
+    seqs = [list(C.__mro__) for C in bases] + [list(bases)]
+    res = []
+    while True:
+        non_empty = list(filter(None, seqs))
+        if not non_empty:
+            # Nothing left to process, we're done.
+            return tuple(res)
+
+        for seq in non_empty:  # Find merge candidates among seq heads.
+            candidate = seq[0]
+            not_head = [s for s in non_empty if candidate in s[1:]]
+            if not_head:
+                # Reject the candidate.
+                candidate = None
+            else:
+                break
+
+        if not candidate:
+            raise TypeError("inconsistent hierarchy, no C3 MRO is possible")
+
+        res.append(candidate)
+        for seq in non_empty:
+            # Remove candidate.
+            if seq[0] == candidate:
+                del seq[0]
+
+
+def create_template_stack(depth):
+    """Return chain of template classes, each deriving from the previous template and a mixin
+
+    :param depth: number of templates in chain
+    """
+    mixins = [type("Mixin{}".format(i), (object,), {}) for i in range(MIXIN_COUNT)]
+
+    templates = [type("Template0", (object,), {})]
+    for i in range(1, depth):
+        bases = templates[-1], mixins[i % MIXIN_COUNT]
+
+        # Mixins already in the MRO of the previous template cannot follow it
+        if bases[1] in bases[0].__mro__:
+            bases = bases[:1]
+
+        templates.append(type("Template{}".format(i), bases, {}))
+
+    return templates
+
+
+def main(argv=None):
+    parser = ArgumentParser(description="Compare determine_mro implementations on deep template stacks")
+    parser.add_argument("--depths", default="10,50,200", help="comma separated template stack depths")
+    parser.add_argument("--selected", type=int, default=4, help="templates selected from top of each stack")
+    parser.add_argument("--number", type=int, default=200, help="calls per repeat")
+    parser.add_argument("--repeat", type=int, default=5, help="number of repeats, of which the best is reported")
+    args = parser.parse_args(argv)
+
+    uncached_determine_mro = determine_mro.__wrapped__
+    implementations = (("quadratic", determine_mro_quadratic), ("linear", uncached_determine_mro),
+                       ("cached", determine_mro))
+
+    print("depth\tmro length\t" + "\t".join("{} us".format(name) for name, _ in implementations))
+
+    for depth in (int(d) for d in args.depths.split(",")):
+        templates = create_template_stack(depth)
+        # Most derived templates first, as a class deriving from them would list them
+        bases = tuple(reversed(templates[-args.selected:]))
+
+        mro = determine_mro_quadratic(*bases)
+        if uncached_determine_mro(*bases) != mro:
+            raise AssertionError("Implementations disagree for depth {}".format(depth))
+
+        times = []
+        for _, implementation in implementations:
+            best = min(repeat(lambda: implementation(*bases), number=args.number, repeat=args.repeat))
+            times.append(best / args.number * 1e6)
+
+        print("{}\t{}\t".format(depth, len(mro)) + "\t".join("{:.1f}".format(t) for t in times))
+
+
+if __name__ == "__main__":
+    main()
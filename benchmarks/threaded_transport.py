@@ -0,0 +1,145 @@
+"""Compare the frame time spent on socket I/O with a plain non-blocking socket, and with ThreadedSocket
+
+Each frame, the logic thread sends a number of packets to a peer process on loopback, which echoes them back, and reads
+every packet received so far, as NetworkManager.send() and receive() do. Frames are paced at the given tick rate. The
+time spent in sendto and recvfrom calls each frame is recorded, and its mean, standard deviation, 99th percentile and
+maximum are reported in milliseconds.
+
+Usage: python threaded_transport.py [--packets 256] [--size 1200] [--frames 600] [--tick-rate 120]
+"""
+from argparse import ArgumentParser
+from multiprocessing import Event, Process, Queue
+from os import path
+from socket import socket, AF_INET, SOCK_DGRAM, SOL_SOCKET, SO_RCVBUF, SO_SNDBUF
+from time import perf_counter, sleep
+import sys
+
+sys.path.insert(0, path.dirname(path.dirname(path.abspath(__file__))))
+
+from transport import ThreadedSocket
+
+
+BUFFER_SIZE = 65536
+SOCKET_BUFFER_BYTES = 4 * 1024 * 1024
+
+
+def create_socket():
+    udp_socket = socket(AF_INET, SOCK_DGRAM)
+    udp_socket.setsockopt(SOL_SOCKET, SO_RCVBUF, SOCKET_BUFFER_BYTES)
+    udp_socket.setsockopt(SOL_SOCKET, SO_SNDBUF, SOCKET_BUFFER_BYTES)
+    udp_socket.bind(("127.0.0.1", 0))
+    return udp_socket
+
+
+def run_echo_peer(addresses, stopped):
+    """Echo received packets to their sender until stopped
+
+    :param addresses: queue, to which the peer address is put
+    :param stopped: event set when the benchmark has finished
+    """
+    peer_socket = create_socket()
+    peer_socket.settimeout(0.05)
+    addresses.put(peer_socket.getsockname())
+
+    while not stopped.is_set():
+        try:
+            data, address = peer_socket.recvfrom(BUFFER_SIZE)
+
+        except OSError:
+            continue
+
+        try:
+            peer_socket.sendto(data, address)
+
+        except OSError:
+            pass
+
+    peer_socket.close()
+
+
+def run_frames(transport, peer_address, packet_count, packet_size, frame_count, tick_rate):
+    """Return I/O time of each frame (in seconds), and number of packets received
+
+    :param transport: socket interface used by the logic thread
+    """
+    packet = bytes(packet_size)
+    frame_interval = 1 / tick_rate
+
+    io_times = []
+    received_count = 0
+
+    for _ in range(frame_count):
+        frame_start = perf_counter()
+
+        # Receive
+        while True:
+            try:
+                transport.recvfrom(BUFFER_SIZE)
+
+            except OSError:
+                break
+
+            received_count += 1
+
+        # Send
+        for _ in range(packet_count):
+            transport.sendto(packet, peer_address)
+
+        io_times.append(perf_counter() - frame_start)
+
+        remaining = frame_interval - (perf_counter() - frame_start)
+        if remaining > 0:
+            sleep(remaining)
+
+    return io_times, received_count
+
+
+def summarise(samples):
+    ordered = sorted(samples)
+    mean = sum(ordered) / len(ordered)
+    deviation = (sum((s - mean) ** 2 for s in ordered) / len(ordered)) ** 0.5
+    return mean, deviation, ordered[int((len(ordered) - 1) * 0.99)], ordered[-1]
+
+
+def main(argv=None):
+    parser = ArgumentParser(description="Compare frame I/O time of plain and threaded sockets on loopback")
+    parser.add_argument("--packets", type=int, default=256, help="packets sent per frame")
+    parser.add_argument("--size", type=int, default=1200, help="packet size (bytes)")
+    parser.add_argument("--frames", type=int, default=600, help="frames measured per transport")
+    parser.add_argument("--tick-rate", type=float, default=120.0, help="frames per second")
+    args = parser.parse_args(argv)
+
+    addresses = Queue()
+    stopped = Event()
+    peer = Process(target=run_echo_peer, args=(addresses, stopped), daemon=True)
+    peer.start()
+
+    peer_address = addresses.get(timeout=10)
+
+    print("transport\tmean ms\tstd ms\tp99 ms\tmax ms\treceived")
+
+    try:
+        for name in ("plain", "threaded"):
+            udp_socket = create_socket()
+            udp_socket.setblocking(False)
+
+            transport = ThreadedSocket(udp_socket) if name == "threaded" else udp_socket
+
+            try:
+                io_times, received_count = run_frames(transport, peer_address, args.packets, args.size, args.frames,
+                                                      args.tick_rate)
+
+            finally:
+                transport.close()
+
+            mean, deviation, p99, maximum = summarise(io_times)
+            print("{}\t{:.3f}\t{:.3f}\t{:.3f}\t{:.3f}\t{}".format(name, mean * 1000, deviation * 1000, p99 * 1000,
+                                                                  maximum * 1000, received_count))
+
+    finally:
+        stopped.set()
+        peer.join(timeout=5)
+
+
+if __name__ == "__main__":
+    main()
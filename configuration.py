@@ -5,18 +5,34 @@ from .utilities import get_bpy_enum, type_to_enum_type
 TYPE_ENUMS = [(c, c, c) for i, c in enumerate(map(type_to_enum_type, (bool, int, float, str)))]
 NETWORK_ENUMS = get_bpy_enum(Netmodes)
 ROLES_ENUMS = get_bpy_enum(Roles)
+QUANTISATION_ENUMS = [("NONE", "None", "Replicate full precision value"),
+                      ("FIXED", "Fixed Point", "Replicate value as integer steps within a range"),
+                      ("HALF", "Half Float", "Replicate value as 16 bit floating point number")]
+METRICS_OUTPUT_ENUMS = [("NONE", "None", "Keep network metrics in memory only"),
+                        ("NDJSON", "JSON Lines", "Append network metrics to a rotating newline-delimited JSON file"),
+                        ("PROMETHEUS", "Prometheus", "Write latest network metrics to a Prometheus textfile")]
 
 CONFIGURATION_FILE = "configuration.json"
 
 DATA_PATH = "network_data"
+ACTOR_BUNDLE_FILENAME = "actors.definition"
+MANIFEST_FILENAME = "manifest.json"
+SCENE_FILENAME = "scene.definition"
 RULES_FILENAME = "rules.py"
 MAINLOOP_FILENAME = "_mainloop.py"
 INTERFACE_FILENAME = "multiplayer.py"
 ACTORS_FILENAME = "actors.py"
 CONTROLLERS_FILENAME = "controllers.py"
 MESSAGES_FILENAME = "messages.py"
+INTEREST_FILENAME = "interest.py"
+QUANTISERS_FILENAME = "quantisers.py"
+TRANSPORT_FILENAME = "transport.py"
+PROFILER_FILENAME = "profiler.py"
+METRICS_FILENAME = "metrics.py"
+TRACKING_FILENAME = "tracking.py"
 REQUIRED_FILES = MAINLOOP_FILENAME, INTERFACE_FILENAME, RULES_FILENAME, ACTORS_FILENAME, CONTROLLERS_FILENAME, \
-                 MESSAGES_FILENAME
+                 MESSAGES_FILENAME, INTEREST_FILENAME, QUANTISERS_FILENAME, TRANSPORT_FILENAME, \
+                 PROFILER_FILENAME, METRICS_FILENAME, TRACKING_FILENAME
 
 DISPATCHER_NAME = "DISPATCHER"
 DISPATCHER_MARKER = "_DISPATCHER"
@@ -0,0 +1,6 @@
+"""Stand-in for the Blender Game Engine API, used to run servers headlessly
+
+Only the parts of the API required by the network runtime are implemented. Scenes are loaded from the definitions
+written when the network state is saved, and logic bricks are not evaluated.
+"""
+from . import logic, types
@@ -0,0 +1,221 @@
+from collections import defaultdict
+from json import load
+from os import path
+from time import perf_counter
+
+from .types import KX_Scene
+
+
+KX_INPUT_NONE = 0
+KX_INPUT_JUST_ACTIVATED = 1
+KX_INPUT_ACTIVE = 2
+KX_INPUT_JUST_RELEASED = 3
+
+KX_ACTION_MODE_PLAY = 0
+KX_ACTION_MODE_LOOP = 1
+KX_ACTION_MODE_PING_PONG = 2
+
+# Value of ESCKEY in bge.events
+EXIT_KEY = 130
+
+SCENE_FILENAME = "scene.definition"
+
+globalDict = {}
+
+_base_path = ""
+_data_path = ""
+_scenes = []
+_pending_scenes = []
+_messages = []
+_received_messages = []
+_message_subscribers = defaultdict(list)
+_logic_tic_rate = 60.0
+_start_time = perf_counter()
+_frame_time = 0.0
+_exit_requested = False
+
+
+class _InputDevice:
+
+    def __init__(self):
+        self.events = defaultdict(int)
+        self.active_events = {}
+
+
+keyboard = _InputDevice()
+mouse = _InputDevice()
+
+
+def set_base_path(base_path):
+    """Set directory which blend-relative paths (//) are resolved against
+
+    :param base_path: path of directory containing network data
+    """
+    global _base_path
+    _base_path = base_path
+
+
+def load_scene(data_path, scene_name, overlay=True):
+    """Add scene from definition written when the network state was saved (with headless scene export enabled)
+
+    :param data_path: path of network data directory
+    :param scene_name: name of scene
+    :param overlay: add scene after existing scenes, otherwise before them (as a background scene)
+    """
+    global _data_path
+
+    file_path = path.join(data_path, scene_name, SCENE_FILENAME)
+    try:
+        with open(file_path, "r") as file:
+            scene_data = load(file)
+
+    except FileNotFoundError as err:
+        raise FileNotFoundError("No scene definition at {}, save the network state with 'Export Headless Scenes' "
+                                "enabled".format(file_path)) from err
+
+    _data_path = data_path
+
+    scene = KX_Scene(scene_name)
+
+    for obj_data in scene_data['objects']:
+        scene.add_definition(obj_data)
+
+    # Parents are assigned once all objects exist
+    for obj_data in scene_data['objects']:
+        parent_name = obj_data.get('parent')
+        if parent_name is None:
+            continue
+
+        obj = _find_object(scene, obj_data['name'])
+        obj.setParent(_find_object(scene, parent_name))
+
+    camera_name = scene_data.get('camera')
+    if camera_name is not None:
+        scene.active_camera = _find_object(scene, camera_name)
+
+    if overlay:
+        _scenes.append(scene)
+
+    else:
+        _scenes.insert(0, scene)
+
+    return scene
+
+
+def _find_object(scene, name):
+    try:
+        return scene.objects[name]
+
+    except KeyError:
+        return scene.objectsInactive[name]
+
+
+def _end_scene(scene):
+    scene.invalid = True
+    _scenes.remove(scene)
+
+
+def expandPath(file_path):
+    if file_path.startswith("//"):
+        return path.join(_base_path, file_path[2:])
+
+    return file_path
+
+
+def getSceneList():
+    return list(_scenes)
+
+
+def getCurrentScene():
+    return _scenes[0]
+
+
+def getCurrentController():
+    return None
+
+
+def addScene(name, overlay=1):
+    # Scenes are added at the start of the next frame, as in the BGE
+    _pending_scenes.append((name, bool(overlay)))
+
+
+def sendMessage(subject, body="", to="", message_from=""):
+    _messages.append((subject, body, to, message_from))
+
+
+def subscribe(subject, callback):
+    """Call function with each message of subject, in the frame after it is sent (as a message sensor would)
+
+    :param subject: message subject
+    :param callback: function accepting (subject, body, to, from) arguments
+    """
+    _message_subscribers[subject].append(callback)
+
+
+def getMessages():
+    """Return messages sent during previous frame, as (subject, body, to, from) tuples"""
+    return list(_received_messages)
+
+
+def NextFrame():
+    global _frame_time
+
+    _frame_time = perf_counter() - _start_time
+
+    # Messages are received in the frame after they are sent, and only for a single frame
+    _received_messages[:] = _messages
+    _messages.clear()
+
+    for message in _received_messages:
+        for callback in _message_subscribers.get(message[0], ()):
+            callback(*message)
+
+    for scene in _scenes:
+        scene._remove_ended_objects()
+
+    for scene_name, overlay in _pending_scenes:
+        load_scene(_data_path, scene_name, overlay)
+
+    _pending_scenes.clear()
+
+    for event in keyboard.events:
+        keyboard.events[event] = KX_INPUT_NONE
+
+    # Report exit key press, so that the game loop handles exit as it would in the BGE
+    if _exit_requested:
+        keyboard.events[EXIT_KEY] = KX_INPUT_JUST_ACTIVATED
+
+
+def endGame():
+    global _exit_requested
+    _exit_requested = True
+
+
+def getExitKey():
+    return EXIT_KEY
+
+
+def setExitKey(key):
+    global EXIT_KEY
+    EXIT_KEY = key
+
+
+def getLogicTicRate():
+    return _logic_tic_rate
+
+
+def setLogicTicRate(tic_rate):
+    global _logic_tic_rate
+    _logic_tic_rate = tic_rate
+
+
+def getRealTime():
+    return perf_counter() - _start_time
+
+
+def getFrameTime():
+    return _frame_time
+
+
+def getAverageFrameRate():
+    return _logic_tic_rate
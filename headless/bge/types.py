@@ -0,0 +1,294 @@
+from mathutils import Matrix, Vector
+
+
+class CListValue(list):
+    """List of named values, which may also be indexed by name"""
+
+    def __getitem__(self, key):
+        if isinstance(key, str):
+            for value in self:
+                if value.name == key:
+                    return value
+
+            raise KeyError(key)
+
+        return super().__getitem__(key)
+
+    def __contains__(self, key):
+        if isinstance(key, str):
+            return any(value.name == key for value in self)
+
+        return super().__contains__(key)
+
+    def get(self, key, default=None):
+        try:
+            return self[key]
+
+        except KeyError:
+            return default
+
+    def from_id(self, value_id):
+        for value in self:
+            if id(value) == value_id:
+                return value
+
+        raise IndexError("No value with id {}".format(value_id))
+
+
+class SCA_ILogicBrick:
+
+    def __init__(self, name, owner=None):
+        self.name = name
+        self.owner = owner
+
+
+class SCA_ISensor(SCA_ILogicBrick):
+    positive = False
+
+
+class SCA_IActuator(SCA_ILogicBrick):
+    pass
+
+
+class SCA_IController(SCA_ILogicBrick):
+    state = 1
+
+    def __init__(self, name, owner=None):
+        super().__init__(name, owner)
+
+        self.sensors = CListValue()
+        self.actuators = CListValue()
+
+
+class SCA_PythonController(SCA_IController):
+    script = ""
+
+
+class KX_NetworkMessageSensor(SCA_ISensor):
+    subject = ""
+
+
+class KX_NetworkMessageActuator(SCA_IActuator):
+    subject = ""
+
+
+class KX_GameObject:
+    """Game object with game properties and a world transform"""
+
+    def __init__(self, name, properties=None, position=(0.0, 0.0, 0.0), orientation=None, scale=(1.0, 1.0, 1.0)):
+        self.name = name
+
+        self._properties = dict(properties) if properties else {}
+
+        self.worldPosition = Vector(position)
+        self.worldOrientation = Matrix(orientation) if orientation is not None else Matrix.Identity(3)
+        self.worldScale = Vector(scale)
+        self.worldLinearVelocity = Vector((0.0, 0.0, 0.0))
+        self.worldAngularVelocity = Vector((0.0, 0.0, 0.0))
+
+        self.parent = None
+        self.children = CListValue()
+
+        self.sensors = CListValue()
+        self.controllers = CListValue()
+        self.actuators = CListValue()
+
+        self.state = 1
+        self.visible = True
+        self.invalid = False
+
+        self.scene = None
+
+    def __repr__(self):
+        return "<{} {!r}>".format(self.__class__.__name__, self.name)
+
+    def __getitem__(self, name):
+        return self._properties[name]
+
+    def __setitem__(self, name, value):
+        self._properties[name] = value
+
+    def __delitem__(self, name):
+        del self._properties[name]
+
+    def __contains__(self, name):
+        return name in self._properties
+
+    @property
+    def localPosition(self):
+        return self.worldPosition
+
+    @localPosition.setter
+    def localPosition(self, value):
+        self.worldPosition = Vector(value)
+
+    @property
+    def localOrientation(self):
+        return self.worldOrientation
+
+    @localOrientation.setter
+    def localOrientation(self, value):
+        self.worldOrientation = Matrix(value)
+
+    def get(self, name, default=None):
+        return self._properties.get(name, default)
+
+    def keys(self):
+        return list(self._properties)
+
+    def getPropertyNames(self):
+        return list(self._properties)
+
+    def copy(self):
+        """Return a copy of this object, used by KX_Scene.addObject"""
+        obj = self.__class__(self.name, self._properties, self.worldPosition, self.worldOrientation,
+                             self.worldScale)
+        return obj
+
+    def setParent(self, parent, compound=True, ghost=True):
+        self.removeParent()
+
+        self.parent = parent
+        parent.children.append(self)
+
+    def removeParent(self):
+        if self.parent is not None:
+            self.parent.children.remove(self)
+            self.parent = None
+
+    def endObject(self):
+        if self.scene is not None:
+            self.scene._end_object(self)
+
+    def sendMessage(self, subject, body="", to=""):
+        from . import logic
+        logic.sendMessage(subject, body, to, self.name)
+
+    def getDistanceTo(self, other):
+        position = other.worldPosition if isinstance(other, KX_GameObject) else Vector(other)
+        return (self.worldPosition - position).length
+
+    def getVectTo(self, other):
+        position = other.worldPosition if isinstance(other, KX_GameObject) else Vector(other)
+        vector = position - self.worldPosition
+        distance = vector.length
+        return distance, vector, vector.normalized() if distance else vector
+
+    # Physics and animation are not simulated headlessly
+    def applyForce(self, force, local=False):
+        pass
+
+    def applyMovement(self, movement, local=False):
+        self.worldPosition += Vector(movement)
+
+    def applyRotation(self, rotation, local=False):
+        pass
+
+    def playAction(self, *args, **kwargs):
+        pass
+
+    def stopAction(self, layer=0):
+        pass
+
+    def isPlayingAction(self, layer=0):
+        return False
+
+    def getActionFrame(self, layer=0):
+        return 0.0
+
+    def setActionFrame(self, frame, layer=0):
+        pass
+
+    def suspendDynamics(self, ghost=False):
+        pass
+
+    def restoreDynamics(self):
+        pass
+
+
+class KX_Camera(KX_GameObject):
+    pass
+
+
+class KX_LightObject(KX_GameObject):
+    pass
+
+
+class BL_ArmatureObject(KX_GameObject):
+    pass
+
+
+class KX_Scene:
+    """Scene of active and inactive game objects"""
+
+    def __init__(self, name):
+        self.name = name
+
+        self.objects = CListValue()
+        self.objectsInactive = CListValue()
+
+        self.active_camera = None
+        self.pre_draw = []
+        self.post_draw = []
+
+        self.invalid = False
+
+        self._ended_objects = []
+
+    def __repr__(self):
+        return "<{} {!r}>".format(self.__class__.__name__, self.name)
+
+    def add_definition(self, data):
+        """Add game object from exported scene definition
+
+        :param data: object definition
+        """
+        obj_class = KX_Camera if data.get('type') == "CAMERA" else KX_GameObject
+        obj = obj_class(data['name'], data['properties'], data['position'], data['orientation'], data['scale'])
+        obj.scene = self
+
+        if data['active']:
+            self.objects.append(obj)
+
+        else:
+            self.objectsInactive.append(obj)
+
+        return obj
+
+    def addObject(self, obj, reference=None, time=0):
+        if isinstance(obj, str):
+            obj = self.objectsInactive[obj]
+
+        new_obj = obj.copy()
+        new_obj.scene = self
+
+        if reference is not None:
+            if isinstance(reference, str):
+                reference = self.objects[reference]
+
+            new_obj.worldPosition = reference.worldPosition.copy()
+            new_obj.worldOrientation = reference.worldOrientation.copy()
+
+        self.objects.append(new_obj)
+        return new_obj
+
+    def _end_object(self, obj):
+        if not obj.invalid:
+            obj.invalid = True
+            self._ended_objects.append(obj)
+
+            for child in list(obj.children):
+                child.endObject()
+
+    def _remove_ended_objects(self):
+        """Remove objects ended during previous frame, as the BGE does at the end of a frame"""
+        if not self._ended_objects:
+            return
+
+        ended = set(map(id, self._ended_objects))
+        self.objects[:] = [obj for obj in self.objects if id(obj) not in ended]
+        self._ended_objects.clear()
+
+    def end(self):
+        from . import logic
+        logic._end_scene(self)
@@ -0,0 +1,267 @@
+"""Measure how many clients a headless server sustains, by connecting increasing numbers of synthetic clients
+
+For each client count, a headless server is started on loopback, and each synthetic client runs in its own process.
+Clients connect with the CONNECT:: message flow, wait for a pawn to be assigned, then invoke the given RPCs of the pawn
+with scripted (circular) argument values. Server tick time, bandwidth and client join latency are reported.
+
+Requires the same modules as server.py.
+
+Usage: python load_generator.py <game directory> --pawn CLASS --spawner OBJECT [--clients 1,2,4,8,16]
+                                [--duration SECONDS] [--rpcs SendPos,SendOri] [--rpc-rate HZ]
+"""
+from argparse import ArgumentParser
+from json import load, loads
+from math import cos, sin
+from multiprocessing import Process, Queue
+from os import path
+from queue import Empty
+from tempfile import TemporaryDirectory
+from time import perf_counter, sleep
+import signal
+import subprocess
+import sys
+
+from server import load_headless_game, create_game_loop
+
+
+SERVER_SCRIPT = path.join(path.dirname(path.abspath(__file__)), "server.py")
+
+# Time (in seconds) allowed for the server to bind before clients connect
+SERVER_START_DELAY = 2.0
+
+
+def find_controlled_pawn(world):
+    """Return actor controlled by this client, or None
+
+    :param world: client network world
+    """
+    from network.enums import Roles
+
+    from actors import SCAActor
+
+    for scene in world.scenes.values():
+        for replicable in scene.replicables.values():
+            if isinstance(replicable, SCAActor) and replicable.roles.local == Roles.autonomous_proxy:
+                return replicable
+
+    return None
+
+
+def invoke_scripted_rpcs(pawn, rpc_names, elapsed):
+    """Set RPC argument properties to positions on a circle, and invoke RPCs
+
+    :param pawn: controlled actor
+    :param rpc_names: names of RPCs to invoke
+    :param elapsed: time since pawn was assigned
+    """
+    game_object = pawn.game_object
+    values = (cos(elapsed), sin(elapsed), 0.0)
+
+    for rpc_name in rpc_names:
+        try:
+            arguments = pawn.rpc_arguments[rpc_name]
+
+        except KeyError:
+            continue
+
+        for argument_name, value in zip(arguments, values):
+            game_object[argument_name] = value
+
+        pawn.invoke_rpc(rpc_name)
+
+
+def run_client(game_directory, port, duration, rpc_names, rpc_rate, results):
+    """Run synthetic client, and put its results in queue
+
+    :param game_directory: directory containing network data
+    :param port: server port
+    :param duration: time (in seconds) to remain connected
+    :param rpc_names: names of RPCs to invoke
+    :param rpc_rate: RPC invocations per second
+    :param results: multiprocessing queue
+    """
+    load_headless_game(game_directory)
+
+    from bge import logic
+
+    from messages import encode_subject
+
+    game_loop = create_game_loop('client')
+    game_loop.push_network_message(encode_subject('CONNECT_TO', "localhost@{}".format(port)))
+
+    time_step = 1 / logic.getLogicTicRate()
+    rpc_interval = 1 / rpc_rate if rpc_rate else None
+
+    start_time = perf_counter()
+    join_latency = None
+    pawn = None
+    pawn_time = 0.0
+    last_rpc_time = 0.0
+    rpc_count = 0
+
+    while True:
+        frame_start = perf_counter()
+        elapsed = frame_start - start_time
+
+        if elapsed >= duration:
+            break
+
+        game_loop.on_step(time_step)
+
+        if pawn is None:
+            if game_loop.world is not None:
+                pawn = find_controlled_pawn(game_loop.world)
+
+                if pawn is not None:
+                    join_latency = perf_counter() - start_time
+                    pawn_time = last_rpc_time = perf_counter()
+
+        elif rpc_interval is not None and frame_start - last_rpc_time >= rpc_interval:
+            invoke_scripted_rpcs(pawn, rpc_names, frame_start - pawn_time)
+            last_rpc_time = frame_start
+            rpc_count += 1
+
+        remaining = time_step - (perf_counter() - frame_start)
+        if remaining > 0:
+            sleep(remaining)
+
+    if game_loop.world is not None:
+        game_loop.cleanup()
+
+    results.put({'join_latency': join_latency, 'rpc_count': rpc_count})
+
+
+def read_metrics(file_path):
+    """Return samples of newline-delimited JSON metrics file"""
+    try:
+        with open(file_path, "r") as file:
+            return [loads(line) for line in file if line.strip()]
+
+    except FileNotFoundError:
+        return []
+
+
+def mean(values):
+    values = [v for v in values if v is not None]
+    return sum(values) / len(values) if values else None
+
+
+def run_step(game_directory, client_count, port, duration, pawn_class_name, spawner_name, rpc_names, rpc_rate,
+             working_directory):
+    """Run server with given number of clients, and return measurements
+
+    :param client_count: number of synthetic clients
+    """
+    metrics_file = path.join(working_directory, "metrics_{}.ndjson".format(client_count))
+    profile_file = path.join(working_directory, "profile_{}.json".format(client_count))
+
+    server = subprocess.Popen([sys.executable, SERVER_SCRIPT, game_directory, "--port", str(port),
+                               "--pawn", pawn_class_name, "--spawner", spawner_name,
+                               "--metrics-file", metrics_file, "--profile", profile_file],
+                              stdout=subprocess.DEVNULL)
+
+    try:
+        sleep(SERVER_START_DELAY)
+
+        results = Queue()
+        clients = [Process(target=run_client, args=(game_directory, port, duration, rpc_names, rpc_rate, results))
+                   for _ in range(client_count)]
+
+        for client in clients:
+            client.start()
+
+        client_results = []
+        for _ in clients:
+            try:
+                client_results.append(results.get(timeout=duration + 30))
+
+            except Empty:
+                break
+
+        for client in clients:
+            client.join(timeout=5)
+            if client.is_alive():
+                client.terminate()
+
+    finally:
+        server.send_signal(signal.SIGTERM)
+
+        try:
+            server.wait(timeout=10)
+
+        except subprocess.TimeoutExpired:
+            server.kill()
+
+    try:
+        with open(profile_file, "r") as file:
+            frame_summary = load(file)['summary']['frame']
+
+    except (FileNotFoundError, KeyError, ValueError):
+        frame_summary = {}
+
+    samples = read_metrics(metrics_file)
+    join_latencies = [r['join_latency'] for r in client_results]
+
+    return {'clients': client_count,
+            'joined': sum(1 for latency in join_latencies if latency is not None),
+            'join_latency': mean(join_latencies),
+            'max_join_latency': max((l for l in join_latencies if l is not None), default=None),
+            'tick_p50': frame_summary.get('p50'), 'tick_p99': frame_summary.get('p99'),
+            'tick_max': frame_summary.get('max'),
+            'send_rate': mean(s.get('send_rate') for s in samples),
+            'receive_rate': mean(s.get('receive_rate') for s in samples)}
+
+
+REPORT_COLUMNS = (("clients", "{}"), ("joined", "{}"), ("join_latency", "{:.3f}s"), ("max_join_latency", "{:.3f}s"),
+                  ("tick_p50", "{:.2f}ms"), ("tick_p99", "{:.2f}ms"), ("tick_max", "{:.2f}ms"),
+                  ("send_rate", "{:.0f}B/s"), ("receive_rate", "{:.0f}B/s"))
+
+# Durations are reported in milliseconds
+MILLISECOND_COLUMNS = {"tick_p50", "tick_p99", "tick_max"}
+
+
+def format_report_row(result):
+    cells = []
+
+    for name, format_string in REPORT_COLUMNS:
+        value = result.get(name)
+
+        if value is None:
+            cells.append("-")
+            continue
+
+        if name in MILLISECOND_COLUMNS:
+            value *= 1000
+
+        cells.append(format_string.format(value))
+
+    return "\t".join(cells)
+
+
+def main(argv=None):
+    parser = ArgumentParser(description="Connect increasing numbers of synthetic clients to a headless server")
+    parser.add_argument("game_directory", help="directory containing the network_data directory")
+    parser.add_argument("--pawn", required=True, help="network object spawned as pawn for each client")
+    parser.add_argument("--spawner", required=True, help="game object at which pawns are spawned")
+    parser.add_argument("--clients", default="1,2,4,8,16", help="comma separated client counts")
+    parser.add_argument("--duration", type=float, default=20.0, help="time (in seconds) to run each client count")
+    parser.add_argument("--rpcs", default="SendPos,SendOri", help="comma separated RPCs invoked by clients")
+    parser.add_argument("--rpc-rate", type=float, default=30.0, help="RPC invocations per second per client")
+    parser.add_argument("--port", type=int, default=1200, help="server port")
+    args = parser.parse_args(argv)
+
+    game_directory = path.abspath(args.game_directory)
+    client_counts = [int(c) for c in args.clients.split(",")]
+    rpc_names = [n for n in args.rpcs.split(",") if n]
+
+    print("\t".join(name for name, _ in REPORT_COLUMNS))
+
+    with TemporaryDirectory() as working_directory:
+        for client_count in client_counts:
+            result = run_step(game_directory, client_count, args.port, args.duration, args.pawn, args.spawner,
+                              rpc_names, args.rpc_rate, working_directory)
+            print(format_report_row(result))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,160 @@
+"""Run a network game as a dedicated server, without the Blender Game Engine
+
+The stand-in bge package in this directory replaces the BGE, and scenes are loaded from the definitions written when
+the network state is saved with "Export Headless Scenes" enabled. Logic bricks are not evaluated, and nothing is
+rendered. As logic bricks usually spawn pawns for new connections, a pawn class and spawner object may be given
+instead.
+
+Requires the PyAuthServer libraries and the mathutils module to be importable.
+
+Usage: python server.py <game directory> [--port PORT] [--tick-rate RATE] [--pawn CLASS --spawner OBJECT]
+                                         [--metrics-file FILE] [--profile FILE]
+"""
+from argparse import ArgumentParser
+from json import load
+from os import path
+import signal
+import sys
+
+
+HEADLESS_DIRECTORY = path.dirname(path.abspath(__file__))
+ADDON_DIRECTORY = path.dirname(HEADLESS_DIRECTORY)
+
+DATA_PATH = "network_data"
+
+
+def load_headless_game(game_directory, tick_rate=None):
+    """Load root scene of game into the stand-in BGE, and return its network settings
+
+    :param game_directory: directory containing network data
+    :param tick_rate: optional logic tick rate
+    """
+    # Stand-in bge and runtime modules are found before any installed versions
+    sys.path[:0] = [HEADLESS_DIRECTORY, ADDON_DIRECTORY]
+
+    from bge import logic
+
+    game_directory = path.abspath(game_directory)
+    data_path = path.join(game_directory, DATA_PATH)
+
+    with open(path.join(data_path, "main.definition"), "r") as file:
+        world_settings = load(file)
+
+    logic.set_base_path(game_directory)
+    logic.load_scene(data_path, world_settings['scene'])
+
+    if tick_rate is not None:
+        logic.setLogicTicRate(tick_rate)
+
+    return world_settings
+
+
+def create_game_loop(netmode_name, settings_overrides=None):
+    """Create game loop, which will set netmode in its first step
+
+    :param netmode_name: name of netmode (server or client)
+    :param settings_overrides: optional settings which replace those of main.definition
+    """
+    from bge import logic
+
+    from _mainloop import GameLoop
+    from messages import encode_subject
+
+    game_loop = GameLoop()
+    logic.game = game_loop
+
+    if settings_overrides:
+        game_loop.settings_overrides.update(settings_overrides)
+
+    # Netmode is usually set by a logic brick
+    game_loop.push_network_message(encode_subject('SET_NETMODE', netmode_name))
+    return game_loop
+
+
+def add_pawn_spawner(game_loop, pawn_class_name, spawner_name):
+    """Spawn pawn for each new connection, as a logic brick responding to the REQUEST_PAWN message would
+
+    :param game_loop: server game loop
+    :param pawn_class_name: name of network object to spawn as pawn
+    :param spawner_name: name of game object which spawns pawns (the pawn is moved to its transform)
+    """
+    from bge import logic
+
+    from messages import encode_object, encode_scene_info, encode_subject
+
+    bge_scene = logic.getSceneList()[0]
+    spawner = bge_scene.objects[spawner_name]
+
+    def on_request_pawn(*message):
+        scene = game_loop.world.scenes[bge_scene.name]
+        subject = encode_object(encode_scene_info(pawn_class_name, scene), spawner)
+        game_loop.push_network_message(encode_subject('PAWN_ASSOCIATE', subject))
+
+    logic.subscribe(encode_subject('REQUEST_PAWN'), on_request_pawn)
+
+
+def run_server(game_directory, port=None, tick_rate=None, pawn_class_name=None, spawner_name=None,
+               metrics_file=None, profile_file=None):
+    """Run server for game, until interrupted
+
+    :param game_directory: directory containing network data
+    :param port: optional port, replacing that of the saved network state
+    :param tick_rate: optional logic tick rate
+    :param pawn_class_name: optional name of network object to spawn as pawn for new connections
+    :param spawner_name: name of game object which spawns pawns, required if pawn class is given
+    :param metrics_file: optional path of newline-delimited JSON file to write network metrics to
+    :param profile_file: optional path of file to write frame profile to on exit
+    """
+    load_headless_game(game_directory, tick_rate)
+
+    from bge import logic
+
+    settings_overrides = {}
+
+    if port is not None:
+        settings_overrides['port'] = port
+
+    if metrics_file is not None:
+        settings_overrides['metrics_output'] = "NDJSON"
+        settings_overrides['metrics_file'] = path.abspath(metrics_file)
+
+    game_loop = create_game_loop('server', settings_overrides)
+
+    if pawn_class_name is not None:
+        add_pawn_spawner(game_loop, pawn_class_name, spawner_name)
+
+    if profile_file is not None:
+        game_loop.profiler.enabled = True
+
+    # Exit through the game loop, as if the exit key were pressed
+    for signal_number in (signal.SIGINT, signal.SIGTERM):
+        signal.signal(signal_number, lambda *args: logic.endGame())
+
+    try:
+        game_loop.run()
+
+    finally:
+        if profile_file is not None:
+            game_loop.profiler.dump(path.abspath(profile_file))
+
+
+def main(argv=None):
+    parser = ArgumentParser(description="Run a network game as a headless dedicated server")
+    parser.add_argument("game_directory", help="directory containing the network_data directory")
+    parser.add_argument("--port", type=int, default=None, help="port to bind server, overrides saved port")
+    parser.add_argument("--tick-rate", type=float, default=None, help="logic ticks per second")
+    parser.add_argument("--pawn", default=None, help="network object spawned as pawn for new connections")
+    parser.add_argument("--spawner", default=None, help="game object at which pawns are spawned")
+    parser.add_argument("--metrics-file", default=None, help="write network metrics to newline-delimited JSON file")
+    parser.add_argument("--profile", default=None, help="record frame profile, written to file (.json or .csv)")
+    args = parser.parse_args(argv)
+
+    if args.pawn is not None and args.spawner is None:
+        parser.error("--spawner is required with --pawn")
+
+    run_server(args.game_directory, args.port, args.tick_rate, args.pawn, args.spawner, args.metrics_file,
+               args.profile)
+
+
+if __name__ == "__main__":
+    main()
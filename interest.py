@@ -0,0 +1,115 @@
+from math import floor
+
+
+class InterestGrid:
+    """Uniform grid of actor positions, used to find actors near a point
+
+    Cells are indexed by X and Y, as BGE scenes are typically laid out on the ground plane
+    """
+
+    def __init__(self, cell_size):
+        """Initialise empty grid
+
+        :param cell_size: width of a grid cell
+        """
+        if cell_size <= 0:
+            raise ValueError("Cell size must be positive")
+
+        self.cell_size = cell_size
+
+        self._cells = {}
+        self._actor_cells = {}
+        self._positions = {}
+
+    def __contains__(self, actor):
+        return actor in self._actor_cells
+
+    def __len__(self):
+        return len(self._actor_cells)
+
+    def _get_cell(self, x, y):
+        cell_size = self.cell_size
+        return floor(x / cell_size), floor(y / cell_size)
+
+    def update(self, actor, position):
+        """Set position of actor in grid
+
+        :param actor: actor instance
+        :param position: world position of actor
+        """
+        x, y, z = position
+        self._positions[actor] = x, y, z
+
+        cell = self._get_cell(x, y)
+        previous_cell = self._actor_cells.get(actor)
+
+        if cell == previous_cell:
+            return
+
+        if previous_cell is not None:
+            self._discard_from_cell(actor, previous_cell)
+
+        try:
+            self._cells[cell].add(actor)
+
+        except KeyError:
+            self._cells[cell] = {actor}
+
+        self._actor_cells[actor] = cell
+
+    def _discard_from_cell(self, actor, cell):
+        actors = self._cells[cell]
+        actors.discard(actor)
+
+        if not actors:
+            del self._cells[cell]
+
+    def remove(self, actor):
+        """Remove actor from grid
+
+        :param actor: actor instance
+        """
+        cell = self._actor_cells.pop(actor)
+        del self._positions[actor]
+
+        self._discard_from_cell(actor, cell)
+
+    def retain(self, actors):
+        """Remove all actors not in the given set
+
+        :param actors: set of actors to keep
+        """
+        for actor in self._actor_cells.keys() - actors:
+            self.remove(actor)
+
+    def query(self, position, radius):
+        """Return set of actors within radius of position
+
+        :param position: world position
+        :param radius: search radius
+        """
+        x, y, z = position
+        min_x, min_y = self._get_cell(x - radius, y - radius)
+        max_x, max_y = self._get_cell(x + radius, y + radius)
+
+        cells = self._cells
+        positions = self._positions
+        radius_squared = radius * radius
+
+        found = set()
+
+        for cell_x in range(min_x, max_x + 1):
+            for cell_y in range(min_y, max_y + 1):
+                try:
+                    actors = cells[cell_x, cell_y]
+
+                except KeyError:
+                    continue
+
+                for actor in actors:
+                    actor_x, actor_y, actor_z = positions[actor]
+
+                    if (actor_x - x) ** 2 + (actor_y - y) ** 2 + (actor_z - z) ** 2 <= radius_squared:
+                        found.add(actor)
+
+        return found
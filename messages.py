@@ -17,7 +17,8 @@ message_prefixes_replicable = dict(
 message_prefixes_global = dict(
     SET_NETMODE="NETMODE=",
     CONNECT_TO="CONNECT::",
-    REQUEST_PAWN="PAWN?"
+    REQUEST_PAWN="PAWN?",
+    PROFILER="PROFILE::"
     )
 
 message_prefixes_scene = dict(
@@ -31,8 +32,55 @@ all_message_prefixes = message_prefixes_replicable.copy()
 all_message_prefixes.update(message_prefixes_scene)
 all_message_prefixes.update(message_prefixes_global)
 
+# Message categories, used to decode the subject of a message
+MESSAGE_GLOBAL = "global"
+MESSAGE_SCENE = "scene"
+MESSAGE_REPLICABLE = "replicable"
 
-def convert_object_message_logic(message_logic_bricks, prefix_dictionary, get_request=None):
+message_categories = {}
+message_categories.update({k: MESSAGE_REPLICABLE for k in message_prefixes_replicable})
+message_categories.update({k: MESSAGE_SCENE for k in message_prefixes_scene})
+message_categories.update({k: MESSAGE_GLOBAL for k in message_prefixes_global})
+
+
+class PrefixIndex:
+    """Lookup table of message prefixes keyed by first character"""
+
+    def __init__(self, prefix_dictionary):
+        candidates = {}
+
+        # Longest prefixes are tested first, so that a shorter prefix cannot shadow a longer one
+        for identifier, prefix in sorted(prefix_dictionary.items(), key=lambda item: -len(item[1])):
+            candidates.setdefault(prefix[0], []).append((identifier, prefix, len(prefix)))
+
+        self._candidates = {k: tuple(v) for k, v in candidates.items()}
+
+    def match(self, subject):
+        """Return identifier and request for subject
+
+        :param subject: message subject
+        """
+        try:
+            candidates = self._candidates[subject[0]]
+
+        except (KeyError, IndexError):
+            raise ValueError("Invalid subject")
+
+        for identifier, prefix, prefix_length in candidates:
+            if subject.startswith(prefix):
+                return identifier, subject[prefix_length:]
+
+        raise ValueError("Invalid subject")
+
+
+# Prefix indices of each message category, and of all categories
+prefix_index_replicable = PrefixIndex(message_prefixes_replicable)
+prefix_index_scene = PrefixIndex(message_prefixes_scene)
+prefix_index_global = PrefixIndex(message_prefixes_global)
+prefix_index_all = PrefixIndex(all_message_prefixes)
+
+
+def convert_object_message_logic(message_logic_bricks, prefix_index, get_request=None):
     """Convert logic bricks which use SCENE message API"""
     # Convert sensors
     for message_handler in message_logic_bricks:
@@ -40,7 +88,7 @@ def convert_object_message_logic(message_logic_bricks, prefix_dictionary, get_re
 
         # Find in scene prefixes
         try:
-            identifier, request = prefix_identifier_from_subject(message_subject, prefix_dictionary)
+            identifier, request = prefix_index.match(message_subject)
 
         except ValueError:
             continue
@@ -51,15 +99,8 @@ def convert_object_message_logic(message_logic_bricks, prefix_dictionary, get_re
         message_handler.subject = encode_subject(identifier, request)
 
 
-def prefix_identifier_from_subject(subject, prefix_dictionary=None):
-    if prefix_dictionary is None:
-        prefix_dictionary = all_message_prefixes
-
-    for identifier, prefix in prefix_dictionary.items():
-        if subject.startswith(prefix):
-            return identifier, subject[len(prefix):]
-
-    raise ValueError("Invalid subject")
+def prefix_identifier_from_subject(subject, prefix_index=prefix_index_all):
+    return prefix_index.match(subject)
 
 
 def encode_subject(identifier, subject=''):
@@ -80,47 +121,164 @@ def decode_subject(encoded_subject):
     return identifier, subject
 
 
-def encode_object(subject, obj):
-    scene = obj.scene
-    scene_id = id(scene)
-    obj_id = id(obj)
-    return dumps((scene_id, obj_id, subject))
+class JSONMessageCodec:
+    """Encode message subjects as JSON arrays
+
+    Readable form, useful for debugging message logic
+    """
+
+    def encode_object(self, subject, obj):
+        return dumps((id(obj.scene), id(obj), subject))
+
+    def decode_object(self, encoded_subject):
+        scene_id, obj_id, subject = loads(encoded_subject)
+        return scene_id, obj_id, subject
+
+    def encode_replicable_info(self, subject, scene_handle, unique_id):
+        return dumps((subject, scene_handle, unique_id))
+
+    def decode_replicable_info(self, encoded_subject):
+        subject, scene_handle, unique_id = loads(encoded_subject)
+        return subject, scene_handle, unique_id
+
+    def encode_scene_info(self, subject, scene_handle):
+        return dumps((subject, scene_handle))
+
+    def decode_scene_info(self, encoded_subject):
+        subject, scene_handle = loads(encoded_subject)
+        return subject, scene_handle
+
+
+class CompactMessageCodec:
+    """Encode message subjects as fields joined by a control character
+
+    Avoids JSON parsing when decoding messages. Integer fields are written in hexadecimal.
+    """
+
+    separator = "\x1f"
+
+    def encode_object(self, subject, obj):
+        separator = self.separator
+        return "{:x}{}{:x}{}{}".format(id(obj.scene), separator, id(obj), separator, subject)
+
+    def decode_object(self, encoded_subject):
+        try:
+            scene_id, obj_id, subject = encoded_subject.split(self.separator, 2)
+            return int(scene_id, 16), int(obj_id, 16), subject
+
+        except ValueError as err:
+            raise ValueError("Invalid object subject {!r}".format(encoded_subject)) from err
+
+    def encode_replicable_info(self, subject, scene_handle, unique_id):
+        separator = self.separator
+        return "{}{}{:x}{}{:x}".format(subject, separator, scene_handle, separator, unique_id)
+
+    def decode_replicable_info(self, encoded_subject):
+        try:
+            subject, scene_handle, unique_id = encoded_subject.rsplit(self.separator, 2)
+            return subject, int(scene_handle, 16), int(unique_id, 16)
+
+        except ValueError as err:
+            raise ValueError("Invalid replicable subject {!r}".format(encoded_subject)) from err
+
+    def encode_scene_info(self, subject, scene_handle):
+        return "{}{}{:x}".format(subject, self.separator, scene_handle)
+
+    def decode_scene_info(self, encoded_subject):
+        try:
+            subject, scene_handle = encoded_subject.rsplit(self.separator, 1)
+            return subject, int(scene_handle, 16)
+
+        except ValueError as err:
+            raise ValueError("Invalid scene subject {!r}".format(encoded_subject)) from err
+
+
+codec = CompactMessageCodec()
+
+
+def set_message_codec(new_codec):
+    """Set codec used to encode and decode message subjects
+
+    Must be called before any message logic is converted, as converted subjects are not re-encoded
+
+    :param new_codec: codec instance
+    """
+    global codec
+    codec = new_codec
 
 
-def decode_object(encoded_subject):
-    from bge import logic
+class SceneRegistry:
+    """Lookup table for BGE scenes by id, and network scenes by integer handle"""
 
-    scene_id, obj_id, subject = loads(encoded_subject)
+    def __init__(self):
+        self.bge_scenes = {}
+
+        self._scenes = {}
+        self._next_handle = 0
+
+    def refresh_bge_scenes(self, bge_scenes):
+        """Rebuild lookup of BGE scenes
+
+        :param bge_scenes: sequence of BGE scenes
+        """
+        self.bge_scenes = {id(s): s for s in bge_scenes}
+
+    def add_scene(self, scene):
+        """Register network scene and return its handle
+
+        :param scene: network scene
+        """
+        handle = self._next_handle
+        self._next_handle += 1
+
+        self._scenes[handle] = scene
+        return handle
+
+    def get_scene(self, handle):
+        try:
+            return self._scenes[handle]
+
+        except KeyError:
+            raise ValueError("No scene with handle {} found".format(handle))
+
+    def get_bge_scene(self, scene_id):
+        try:
+            return self.bge_scenes[scene_id]
+
+        except KeyError:
+            raise ValueError("No BGE scene with id {} found".format(scene_id))
+
+
+def encode_object(subject, obj):
+    return codec.encode_object(subject, obj)
 
-    for scene in logic.getSceneList():
-        if id(scene) == scene_id:
-            break
 
-    else:
-        raise ValueError("No BGE scene with id {} found".format(scene_id))
+def decode_object(registry, encoded_subject):
+    scene_id, obj_id, subject = codec.decode_object(encoded_subject)
 
+    scene = registry.get_bge_scene(scene_id)
     obj = scene.objects.from_id(obj_id)
     return subject, obj
 
 
 def encode_replicable_info(subject, replicable):
-    return dumps((subject, replicable.scene.name, replicable.unique_id))
+    return codec.encode_replicable_info(subject, replicable.scene.handle, replicable.unique_id)
 
 
 def encode_scene_info(subject, scene):
-    return dumps((subject, scene.name))
+    return codec.encode_scene_info(subject, scene.handle)
 
 
-def decode_scene_info(world, encoded_subject):
-    subject, scene_id = loads(encoded_subject)
-    scene = world.scenes[scene_id]
+def decode_scene_info(registry, encoded_subject):
+    subject, scene_handle = codec.decode_scene_info(encoded_subject)
+    scene = registry.get_scene(scene_handle)
     return subject, scene
 
 
-def decode_replicable_info(world, encoded_subject):
-    subject, scene_id, replicable_id = loads(encoded_subject)
+def decode_replicable_info(registry, encoded_subject):
+    subject, scene_handle, replicable_id = codec.decode_replicable_info(encoded_subject)
 
-    scene = world.scenes[scene_id]
+    scene = registry.get_scene(scene_handle)
     try:
         replicable = scene.replicables[replicable_id]
 
@@ -0,0 +1,206 @@
+from collections import deque
+from json import dumps
+from os import path, remove, replace
+from time import time
+
+
+class PacketCounter:
+    """Socket interface which counts the packets sent and received through it"""
+
+    def __init__(self, socket):
+        """Wrap socket
+
+        :param socket: socket (or socket interface) used by the network manager
+        """
+        self._socket = socket
+
+        self.sent_packets = 0
+        self.received_packets = 0
+
+    def __getattr__(self, name):
+        return getattr(self._socket, name)
+
+    def recvfrom(self, buffer_size=None):
+        result = self._socket.recvfrom(buffer_size)
+        self.received_packets += 1
+        return result
+
+    def sendto(self, data, address):
+        result = self._socket.sendto(data, address)
+        self.sent_packets += 1
+        return result
+
+    def reset(self):
+        """Reset packet counts, at the start of a new sample window"""
+        self.sent_packets = 0
+        self.received_packets = 0
+
+
+def get_round_trip_times(world, controller_cls):
+    """Return round trip time (ping) of each connected player, keyed by player controller ID
+
+    :param world: network world
+    :param controller_cls: class of player controllers, whose replication info measures ping
+    """
+    round_trip_times = {}
+
+    for scene in world.scenes.values():
+        for replicable in scene.replicables.values():
+            if isinstance(replicable, controller_cls) and replicable.info is not None:
+                round_trip_times[str(replicable.unique_id)] = replicable.info.ping
+
+    return round_trip_times
+
+
+def create_metrics_sample(network_manager, packet_counter, world, controller_cls, duration):
+    """Return metrics of the current sample window as a dictionary
+
+    :param network_manager: network manager instance
+    :param packet_counter: packet counter of network manager socket
+    :param world: network world
+    :param controller_cls: class of player controllers
+    :param duration: length of sample window (in seconds)
+    """
+    network_metrics = network_manager.metrics
+
+    return {'time': time(), 'duration': duration,
+            'sent_bytes': network_metrics.sent_bytes, 'received_bytes': network_metrics.received_bytes,
+            'sent_packets': packet_counter.sent_packets, 'received_packets': packet_counter.received_packets,
+            'send_rate': network_metrics.send_rate, 'receive_rate': network_metrics.receive_rate,
+            'round_trip_times': get_round_trip_times(world, controller_cls),
+            'replicables': {name: len(scene.replicables) for name, scene in world.scenes.items()}}
+
+
+class NDJSONMetricsWriter:
+    """Append samples to a newline-delimited JSON file, rotated when it grows too large"""
+
+    default_filename = "network_metrics.ndjson"
+
+    def __init__(self, file_path, max_bytes=4 * 1024 * 1024, backup_count=3):
+        """Open metrics file
+
+        :param file_path: path of metrics file
+        :param max_bytes: size beyond which file is rotated
+        :param backup_count: number of rotated files retained
+        """
+        self.file_path = file_path
+        self.max_bytes = max_bytes
+        self.backup_count = backup_count
+
+        self._file = open(file_path, "a")
+
+    def _rotate(self):
+        self._file.close()
+
+        file_path = self.file_path
+        for i in range(self.backup_count - 1, 0, -1):
+            source = "{}.{}".format(file_path, i)
+            if path.exists(source):
+                replace(source, "{}.{}".format(file_path, i + 1))
+
+        if self.backup_count:
+            replace(file_path, "{}.1".format(file_path))
+
+        else:
+            remove(file_path)
+
+        self._file = open(file_path, "a")
+
+    def write(self, sample):
+        file = self._file
+        file.write(dumps(sample) + "\n")
+        file.flush()
+
+        if file.tell() >= self.max_bytes:
+            self._rotate()
+
+    def close(self):
+        self._file.close()
+
+
+class PrometheusMetricsWriter:
+    """Write latest sample to a Prometheus textfile, for the node exporter textfile collector"""
+
+    default_filename = "network_metrics.prom"
+    prefix = "bge_network"
+
+    def __init__(self, file_path):
+        """Set metrics file
+
+        :param file_path: path of metrics file (should end in .prom)
+        """
+        self.file_path = file_path
+
+    def format_sample(self, sample):
+        """Return sample in Prometheus text exposition format
+
+        :param sample: metrics sample
+        """
+        prefix = self.prefix
+        lines = []
+
+        for name, value in sorted(sample.items()):
+            if isinstance(value, (int, float)):
+                lines.append("{}_{} {!r}".format(prefix, name, value))
+
+        for controller_id, round_trip_time in sorted(sample['round_trip_times'].items()):
+            lines.append('{}_round_trip_time{{controller="{}"}} {!r}'.format(prefix, controller_id, round_trip_time))
+
+        for scene_name, count in sorted(sample['replicables'].items()):
+            lines.append('{}_replicables{{scene="{}"}} {}'.format(prefix, scene_name, count))
+
+        return "\n".join(lines) + "\n"
+
+    def write(self, sample):
+        # Write to temporary file first, so that the collector never reads a partial file
+        temporary_path = self.file_path + ".tmp"
+
+        with open(temporary_path, "w") as file:
+            file.write(self.format_sample(sample))
+
+        replace(temporary_path, self.file_path)
+
+    def close(self):
+        pass
+
+
+metrics_writers = {"NDJSON": NDJSONMetricsWriter, "PROMETHEUS": PrometheusMetricsWriter}
+
+
+class MetricsTimeSeries:
+    """Bounded history of network metrics samples, optionally streamed to a file"""
+
+    def __init__(self, max_samples=256, writer=None):
+        """Initialise empty time series
+
+        :param max_samples: number of samples retained in memory
+        :param writer: optional writer, with write(sample) and close() methods
+        """
+        self.samples = deque(maxlen=max_samples)
+        self.writer = writer
+
+    def __len__(self):
+        return len(self.samples)
+
+    def __iter__(self):
+        return iter(self.samples)
+
+    def record(self, sample):
+        """Append sample to time series
+
+        :param sample: metrics sample
+        """
+        self.samples.append(sample)
+
+        if self.writer is not None:
+            try:
+                self.writer.write(sample)
+
+            except OSError as err:
+                print("Unable to write network metrics, disabling output: {}".format(err))
+                self.writer = None
+
+    def close(self):
+        if self.writer is not None:
+            self.writer.close()
+            self.writer = None
@@ -0,0 +1,51 @@
+from collections import Counter, deque
+from functools import lru_cache
+from itertools import islice
+
+
+MRO_CACHE_SIZE = 256
+
+
+@lru_cache(maxsize=MRO_CACHE_SIZE)
+def determine_mro(*bases):
+    """Calculate the Method Resolution Order of bases using the C3 algorithm.
+
+    Suppose you intended creating a class K with the given base classes. This
+    function returns the MRO which K would have, *excluding* K itself (since
+    it doesn't yet exist), as if you had actually created the class.
+
+    Another way of looking at this, if you pass a single class K, this will
+    return the linearization of K (the MRO of K, *including* itself).
+
+    Results are memoised by bases. Each sequence tracks how many times a class
+    appears outside a sequence head, so candidates are tested in constant time.
+    """
+    seqs = [deque(C.__mro__) for C in bases] + [deque(bases)]
+
+    tail_counts = Counter()
+    for seq in seqs:
+        tail_counts.update(islice(seq, 1, None))
+
+    res = []
+    while True:
+        seqs = [s for s in seqs if s]
+        if not seqs:
+            # Nothing left to process, we're done.
+            return tuple(res)
+
+        for seq in seqs:  # Find merge candidates among seq heads.
+            candidate = seq[0]
+            if not tail_counts[candidate]:
+                break
+
+        else:
+            raise TypeError("inconsistent hierarchy, no C3 MRO is possible")
+
+        res.append(candidate)
+        for seq in seqs:
+            # Remove candidate, its successor leaves the tail.
+            if seq[0] is candidate:
+                seq.popleft()
+
+                if seq:
+                    tail_counts[seq[0]] -= 1
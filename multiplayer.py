@@ -2,6 +2,7 @@ from _mainloop import *
 
 from bge import logic
 
+from ast import literal_eval
 import sys
 import re
 
@@ -17,12 +18,19 @@ else:
             self.get_function_name = re.compile('.*?(?=\()')
 
         def __getattr__(self, name):
+            if name == "__all__":
+                return [k for k in globals().keys() if not k.startswith("_")]
+
+            resolved = self._resolve(name)
+
+            # Store on instance so that future lookups do not reach __getattr__
+            setattr(self, name, resolved)
+            return resolved
+
+        def _resolve(self, name):
             match = re.search(self.get_function_name, name)
 
             if match is None:
-                if name == "__all__":
-                    return [k for k in globals().keys() if not k.startswith("_")]
-
                 try:
                     return globals()[name]
 
@@ -30,7 +38,10 @@ else:
                     raise AttributeError(name)
 
             function_name = match.group(0)
-            if function_name not in globals():
+            try:
+                function = globals()[function_name]
+
+            except KeyError:
                 raise AttributeError(function_name)
 
             argument_match = re.search(self.get_arguments, name)
@@ -40,10 +51,22 @@ else:
             else:
                 arguments = argument_match.group(1)
 
-            data = globals().copy()
-            data["cont"] = logic.getCurrentController()
+            try:
+                argument_values = literal_eval("({},)".format(arguments)) if arguments.strip() else ()
+
+            # Arguments may refer to names, so must be evaluated each call
+            except (ValueError, SyntaxError):
+                data = globals().copy()
+                code = compile("{}(cont, {})".format(function_name, arguments), name, "exec")
+
+                def invoke():
+                    data["cont"] = logic.getCurrentController()
+                    exec(code, data)
+
+                return invoke
 
-            return lambda: exec("{}(cont, {})".format(function_name, arguments), data)
+            get_current_controller = logic.getCurrentController
+            return lambda: function(get_current_controller(), *argument_values)
 
 
     sys.modules[__name__] = Interface()
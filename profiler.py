@@ -0,0 +1,118 @@
+from csv import writer
+from json import dump
+from os import path
+from time import perf_counter
+
+
+class FrameProfiler:
+    """Record durations of the phases of each frame in fixed-size ring buffers"""
+
+    def __init__(self, phases, size=1024):
+        """Initialise profiler
+
+        :param phases: ordered sequence of phase names
+        :param size: number of frames retained
+        """
+        self.phases = tuple(phases)
+        self.size = size
+
+        self.enabled = False
+
+        self._samples = {}
+        self._frame_samples = []
+        self._index = 0
+        self._count = 0
+
+        self._frame_start = 0.0
+        self._last_time = 0.0
+
+        self.reset()
+
+    def __len__(self):
+        return self._count
+
+    def reset(self):
+        """Discard all recorded frames"""
+        size = self.size
+
+        self._samples = {phase: [0.0] * size for phase in self.phases}
+        self._frame_samples = [0.0] * size
+        self._index = 0
+        self._count = 0
+
+    def begin_frame(self):
+        """Start timing a new frame"""
+        index = self._index
+
+        # Phases which are not marked this frame take no time
+        for samples in self._samples.values():
+            samples[index] = 0.0
+
+        self._frame_start = self._last_time = perf_counter()
+
+    def mark(self, phase):
+        """Record time since the previous mark as duration of phase
+
+        :param phase: name of phase which just ended
+        """
+        now = perf_counter()
+        self._samples[phase][self._index] = now - self._last_time
+        self._last_time = now
+
+    def end_frame(self):
+        """Finish timing current frame"""
+        index = self._index
+        self._frame_samples[index] = perf_counter() - self._frame_start
+
+        self._index = (index + 1) % self.size
+        if self._count < self.size:
+            self._count += 1
+
+    def _ordered(self, samples):
+        """Return samples of recorded frames, oldest first"""
+        if self._count < self.size:
+            return samples[:self._count]
+
+        index = self._index
+        return samples[index:] + samples[:index]
+
+    def get_samples(self):
+        """Return mapping from phase name to recorded durations, oldest first, including total frame duration"""
+        samples = {phase: self._ordered(self._samples[phase]) for phase in self.phases}
+        samples['frame'] = self._ordered(self._frame_samples)
+        return samples
+
+    @staticmethod
+    def _summarise(samples):
+        if not samples:
+            return dict(mean=0.0, p50=0.0, p95=0.0, p99=0.0, max=0.0)
+
+        ordered = sorted(samples)
+        last = len(ordered) - 1
+
+        return dict(mean=sum(ordered) / len(ordered), p50=ordered[int(last * 0.50)], p95=ordered[int(last * 0.95)],
+                    p99=ordered[int(last * 0.99)], max=ordered[last])
+
+    def get_summary(self):
+        """Return mapping from phase name to duration statistics (in seconds)"""
+        return {phase: self._summarise(samples) for phase, samples in self.get_samples().items()}
+
+    def dump(self, file_path):
+        """Write recorded frames to file, as CSV if the file extension is .csv, otherwise as JSON
+
+        :param file_path: path of output file
+        """
+        samples = self.get_samples()
+        columns = self.phases + ('frame',)
+
+        if path.splitext(file_path)[1].lower() == ".csv":
+            with open(file_path, "w", newline="") as file:
+                csv_writer = writer(file)
+                csv_writer.writerow(columns)
+                csv_writer.writerows(zip(*(samples[phase] for phase in columns)))
+
+        else:
+            data = dict(frames=self._count, phases=list(columns), summary=self.get_summary(), samples=samples)
+
+            with open(file_path, "w") as file:
+                dump(data, file)
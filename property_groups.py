@@ -1,7 +1,8 @@
 from bpy import types, props, utils
 
-from .configuration import NETWORK_ENUMS, TYPE_ENUMS
-from .utilities import determine_mro
+from .configuration import NETWORK_ENUMS, QUANTISATION_ENUMS, TYPE_ENUMS
+from .mro import determine_mro
+from .utilities import load_template_module
 
 
 class AttributeGroup(types.PropertyGroup):
@@ -13,6 +14,20 @@ class AttributeGroup(types.PropertyGroup):
                                                                         "client")
     replicate_after_initial = props.BoolProperty(default=True, description="Replicate this game property after initial "
                                                                            "replication")
+    priority = props.IntProperty(default=5, min=1, max=5, description="Replication priority of this game property, "
+                                                                      "lower priorities are sent less often when "
+                                                                      "over the bandwidth budget")
+    update_interval = props.FloatProperty(default=0.0, min=0.0, description="Minimum time (in seconds) between "
+                                                                            "replications of this game property")
+    quantisation = props.EnumProperty(items=QUANTISATION_ENUMS,
+                                      description="Reduced precision encoding of game property")
+    quantise_min = props.FloatProperty(default=-100.0,
+                                       description="Lowest value of game property represented by fixed point encoding")
+    quantise_max = props.FloatProperty(default=100.0,
+                                       description="Highest value of game property represented by fixed point encoding")
+    quantise_precision = props.FloatProperty(default=0.01, min=0.0001, precision=4,
+                                             description="Smallest difference between values of game property "
+                                                         "represented by fixed point encoding")
 
 
 utils.register_class(AttributeGroup)
@@ -24,6 +39,15 @@ class RPCArgumentGroup(types.PropertyGroup):
     name = props.StringProperty(description="Name of game property")
     type = props.StringProperty(description="Data type of RPC argument")
     replicate = props.BoolProperty(default=False, description="Replicate this game property with RPC call")
+    quantisation = props.EnumProperty(items=QUANTISATION_ENUMS,
+                                      description="Reduced precision encoding of RPC argument")
+    quantise_min = props.FloatProperty(default=-100.0,
+                                       description="Lowest value of RPC argument represented by fixed point encoding")
+    quantise_max = props.FloatProperty(default=100.0,
+                                       description="Highest value of RPC argument represented by fixed point encoding")
+    quantise_precision = props.FloatProperty(default=0.01, min=0.0001, precision=4,
+                                             description="Smallest difference between values of RPC argument "
+                                                         "represented by fixed point encoding")
 
 
 utils.register_class(RPCArgumentGroup)
@@ -98,7 +122,7 @@ def on_template_updated(self, context):
             continue
 
         try:
-            module = __import__(template_path, fromlist=[''])
+            module = load_template_module(template_path)
 
         except ImportError:
             return
@@ -0,0 +1,115 @@
+from math import ceil, copysign, frexp, isinf, isnan
+
+
+INF = float("inf")
+NAN = float("nan")
+
+
+class FixedPointQuantiser:
+    """Encode floats within a range as integers of a given precision"""
+
+    def __init__(self, minimum, maximum, precision):
+        """Initialise quantiser
+
+        :param minimum: lowest representable value
+        :param maximum: highest representable value
+        :param precision: difference between successive representable values
+        """
+        if maximum <= minimum:
+            raise ValueError("Maximum must exceed minimum")
+
+        if precision <= 0:
+            raise ValueError("Precision must be positive")
+
+        self.minimum = minimum
+        self.maximum = maximum
+        self.precision = precision
+
+        self.max_value = int(ceil((maximum - minimum) / precision))
+
+    def __repr__(self):
+        return "FixedPointQuantiser({!r}, {!r}, {!r})".format(self.minimum, self.maximum, self.precision)
+
+    def encode(self, value):
+        # NaN has no position within the range, so is sent as the minimum
+        if isnan(value):
+            return 0
+
+        # Clamp before rounding, as infinities cannot be rounded
+        value = min(max(value, self.minimum), self.maximum)
+        step = int(round((value - self.minimum) / self.precision))
+        return min(step, self.max_value)
+
+    def decode(self, value):
+        return min(self.minimum + value * self.precision, self.maximum)
+
+
+class HalfFloatQuantiser:
+    """Encode floats as IEEE 754 half precision bit patterns"""
+
+    max_value = 0xFFFF
+
+    def __repr__(self):
+        return "HalfFloatQuantiser()"
+
+    def encode(self, value):
+        if isnan(value):
+            return 0x7E00
+
+        sign = 0x8000 if copysign(1.0, value) < 0 else 0
+        value = abs(value)
+
+        if isinf(value):
+            return sign | 0x7C00
+
+        if not value:
+            return sign
+
+        mantissa, exponent = frexp(value)
+        exponent -= 1
+
+        # Subnormal numbers have a fixed exponent of -14
+        if exponent < -14:
+            return sign | int(round(value * (1 << 24)))
+
+        fraction = int(round((mantissa * 2 - 1) * 1024))
+        if fraction == 1024:
+            fraction = 0
+            exponent += 1
+
+        if exponent > 15:
+            return sign | 0x7C00
+
+        return sign | ((exponent + 15) << 10) | fraction
+
+    def decode(self, value):
+        sign = -1.0 if value & 0x8000 else 1.0
+        exponent = (value >> 10) & 0x1F
+        fraction = value & 0x3FF
+
+        if exponent == 0:
+            return sign * fraction / (1 << 24)
+
+        if exponent == 0x1F:
+            return sign * INF if not fraction else NAN
+
+        return sign * (1 + fraction / 1024) * 2.0 ** (exponent - 15)
+
+
+def create_quantiser(data):
+    """Create quantiser from definition data
+
+    :param data: quantisation data from actor definition, or None
+    """
+    if not data:
+        return None
+
+    mode = data['mode']
+
+    if mode == "FIXED":
+        return FixedPointQuantiser(data['minimum'], data['maximum'], data['precision'])
+
+    elif mode == "HALF":
+        return HalfFloatQuantiser()
+
+    raise ValueError("Unknown quantisation mode {}".format(mode))
@@ -5,35 +5,145 @@ from game_system.entity import Actor
 
 from bge import logic
 
+from actors import SCAActor
+from interest import InterestGrid
+
+
+# Relevance of actors depends upon their distance to controlled pawns. Actors far from every pawn are culled for all
+# clients; relevance is not decided per connection.
+SPATIALLY_RELEVANT = "spatial"
+
 
 class Rules:
 
+    def __init__(self, relevance_radius=None, interest_cell_size=None):
+        """Initialise rules
+
+        :param relevance_radius: optional distance beyond which actors are not relevant to any controlled pawn
+        :param interest_cell_size: width of interest grid cells, defaults to relevance radius
+        """
+        self.relevance_radius = relevance_radius
+
+        self._relevance_by_class = {}
+
+        if relevance_radius is None:
+            self.interest_grid = None
+
+        else:
+            self.interest_grid = InterestGrid(interest_cell_size or relevance_radius)
+
+        self._relevant_actors = set()
+
+        self.connection_count = 0
+
     def pre_initialise(self, connection_info):
         return
-    
+
     def on_disconnected(self, replication_manager, root_replicables):
+        self.connection_count -= 1
+
         for replicable in root_replicables:
             scene = replicable.scene
 
             scene.remove_replicable(replicable)
-    
+
     def post_initialise(self, replication_manager):
+        self.connection_count += 1
+
         # Ask for a pawn to be spawned
         logic.game.create_new_player(replication_manager)
         print("SPAWN")
-            
-    def is_relevant(self, replicable):
-        if isinstance(replicable, PawnController):
+
+    def invalidate_relevance_cache(self):
+        """Clear cached relevance of replicable classes, required if classes are modified"""
+        self._relevance_by_class.clear()
+
+    def update_viewers(self, world):
+        """Update interest grid from actor positions, and find actors near any controlled pawn, which are not culled
+
+        Should be called before each full network update, rather than every frame
+
+        :param world: network world
+        """
+        interest_grid = self.interest_grid
+        if interest_grid is None:
+            return
+
+        actors = set()
+        viewers = []
+
+        for scene in world.scenes.values():
+            for replicable in scene.replicables.values():
+                if isinstance(replicable, SCAActor):
+                    game_object = replicable.game_object
+                    if game_object is None or game_object.invalid:
+                        continue
+
+                    interest_grid.update(replicable, game_object.worldPosition)
+                    actors.add(replicable)
+
+                elif isinstance(replicable, PawnController):
+                    pawn = replicable.pawn
+                    if pawn is not None:
+                        viewers.append(pawn)
+
+        interest_grid.retain(actors)
+
+        radius = self.relevance_radius
+        relevant_actors = set()
+
+        for pawn in viewers:
+            try:
+                position = pawn.game_object.worldPosition
+
+            except AttributeError:
+                position = pawn.transform.world_position
+
+            relevant_actors.update(interest_grid.query(position, radius))
+
+        self._relevant_actors = relevant_actors
+
+    def _get_class_relevance(self, cls):
+        if issubclass(cls, PawnController):
             return False
-        
-        elif isinstance(replicable, Actor):
-            return True
-        
-        elif isinstance(replicable, ReplicationInfo):
+
+        elif issubclass(cls, Actor):
+            return True if self.relevance_radius is None else SPATIALLY_RELEVANT
+
+        elif issubclass(cls, ReplicationInfo):
             return True
 
-        elif replicable.always_relevant:
+        # Determined by instance
+        return None
+
+    def _is_spatially_relevant(self, replicable):
+        # Actors not tracked by the interest grid are always relevant
+        if replicable not in self.interest_grid:
             return True
 
+        return replicable in self._relevant_actors
+
+    def is_relevant(self, replicable):
+        """Return True if replicable should be replicated
+
+        The network library does not pass the receiving connection, so relevance is shared by all connections;
+        spatially relevant actors near any controlled pawn are sent to every client.
+        """
+        cls = replicable.__class__
+
+        try:
+            relevance = self._relevance_by_class[cls]
+
+        except KeyError:
+            relevance = self._relevance_by_class[cls] = self._get_class_relevance(cls)
+
+        if relevance is None:
+            return replicable.always_relevant
+
+        if relevance is SPATIALLY_RELEVANT:
+            return replicable.always_relevant or self._is_spatially_relevant(replicable)
+
+        return relevance
+
 
 # TODO allow BGE (logic bricks) scene to handle incoming controller - spawn in right scene
@@ -0,0 +1,5 @@
+from os import path
+import sys
+
+# Runtime and pure helper modules are imported by name, as they are in the game
+sys.path.insert(0, path.dirname(path.dirname(path.abspath(__file__))))
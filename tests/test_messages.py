@@ -0,0 +1,21 @@
+import pytest
+
+from messages import PrefixIndex, all_message_prefixes, prefix_identifier_from_subject, prefix_index_scene
+
+
+def test_identifier_from_subject():
+    for identifier, prefix in all_message_prefixes.items():
+        assert prefix_identifier_from_subject(prefix + "request") == (identifier, "request")
+
+
+def test_longest_prefix_matches_first():
+    prefix_index = PrefixIndex(dict(SHORT="NEW", LONG="NEW_PAWN="))
+
+    assert prefix_index.match("NEW_PAWN=Player") == ("LONG", "Player")
+    assert prefix_index.match("NEW_OBJECT") == ("SHORT", "_OBJECT")
+
+
+@pytest.mark.parametrize("subject", ["", "unprefixed", "@rpc"])
+def test_invalid_subject(subject):
+    with pytest.raises(ValueError):
+        prefix_identifier_from_subject(subject, prefix_index_scene)
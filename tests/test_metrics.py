@@ -0,0 +1,128 @@
+from json import loads
+
+from metrics import MetricsTimeSeries, NDJSONMetricsWriter, PacketCounter, PrometheusMetricsWriter, \
+    create_metrics_sample
+
+
+class StandInPlayerController:
+    """Controller spawned for each connection, with replicated player info"""
+
+    def __init__(self, unique_id, ping):
+        self.unique_id = unique_id
+        self.info = StandInInfo(ping)
+
+
+class StandInInfo:
+
+    def __init__(self, ping):
+        self.ping = ping
+
+
+class StandInReplicable:
+    pass
+
+
+class StandInScene:
+
+    def __init__(self, replicables):
+        self.replicables = {i: replicable for i, replicable in enumerate(replicables)}
+
+
+class StandInWorld:
+
+    def __init__(self, scenes):
+        self.scenes = scenes
+
+
+class StandInMetrics:
+    sent_bytes = 1200
+    received_bytes = 300
+    send_rate = 2400.0
+    receive_rate = 600.0
+
+
+class StandInNetworkManager:
+    metrics = StandInMetrics()
+
+
+class StandInSocket:
+
+    def __init__(self):
+        self.received = [(b"abc", ("127.0.0.1", 1200))]
+        self.sent = []
+
+    def recvfrom(self, buffer_size):
+        try:
+            return self.received.pop()
+
+        except IndexError:
+            raise BlockingIOError
+
+    def sendto(self, data, address):
+        self.sent.append((data, address))
+        return len(data)
+
+
+def create_world():
+    controllers = [StandInPlayerController(1, 0.05), StandInPlayerController(4, 0.12)]
+    return StandInWorld({"Scene": StandInScene(controllers + [StandInReplicable()]),
+                         "Lobby": StandInScene([StandInReplicable()])})
+
+
+def create_packet_counter():
+    packet_counter = PacketCounter(StandInSocket())
+
+    packet_counter.sendto(b"abcd", ("127.0.0.1", 1200))
+    packet_counter.sendto(b"efgh", ("127.0.0.1", 1200))
+    packet_counter.recvfrom(1024)
+
+    try:
+        packet_counter.recvfrom(1024)
+
+    except BlockingIOError:
+        pass
+
+    return packet_counter
+
+
+def test_sample_from_world():
+    sample = create_metrics_sample(StandInNetworkManager(), create_packet_counter(), create_world(),
+                                   StandInPlayerController, 1.0)
+
+    assert sample['duration'] == 1.0
+    assert (sample['sent_bytes'], sample['received_bytes']) == (1200, 300)
+    assert (sample['sent_packets'], sample['received_packets']) == (2, 1)
+    assert (sample['send_rate'], sample['receive_rate']) == (2400.0, 600.0)
+    assert sample['round_trip_times'] == {"1": 0.05, "4": 0.12}
+    assert sample['replicables'] == {"Scene": 3, "Lobby": 1}
+
+
+def test_packet_counter_reset():
+    packet_counter = create_packet_counter()
+    packet_counter.reset()
+
+    assert (packet_counter.sent_packets, packet_counter.received_packets) == (0, 0)
+    assert len(packet_counter.sent) == 2
+
+
+def test_written_samples(tmpdir):
+    sample = create_metrics_sample(StandInNetworkManager(), create_packet_counter(), create_world(),
+                                   StandInPlayerController, 1.0)
+
+    ndjson_path = str(tmpdir.join("metrics.ndjson"))
+    series = MetricsTimeSeries(max_samples=1, writer=NDJSONMetricsWriter(ndjson_path))
+    series.record(sample)
+    series.record(sample)
+    series.close()
+
+    assert len(series) == 1
+
+    with open(ndjson_path) as file:
+        lines = file.readlines()
+
+    assert len(lines) == 2
+    assert loads(lines[0])['round_trip_times'] == {"1": 0.05, "4": 0.12}
+
+    prometheus_text = PrometheusMetricsWriter(str(tmpdir.join("metrics.prom"))).format_sample(sample)
+    assert 'bge_network_round_trip_time{controller="4"} 0.12' in prometheus_text
+    assert "bge_network_sent_packets 2" in prometheus_text
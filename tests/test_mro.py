@@ -0,0 +1,45 @@
+from random import Random
+
+import pytest
+
+from mro import determine_mro
+
+
+def create_random_hierarchy(random, class_count=12, max_bases=3):
+    """Return list of classes, each deriving from up to max_bases earlier classes (if C3 permits)"""
+    classes = []
+
+    for i in range(class_count):
+        base_count = random.randint(0, min(max_bases, len(classes)))
+        bases = tuple(random.sample(classes, base_count)) or (object,)
+
+        try:
+            cls = type("C{}".format(i), bases, {})
+
+        except TypeError:
+            cls = type("C{}".format(i), (object,), {})
+
+        classes.append(cls)
+
+    return classes
+
+
+@pytest.mark.parametrize("seed", range(2000))
+def test_matches_type_mro(seed):
+    random = Random(seed)
+    classes = create_random_hierarchy(random)
+
+    for cls in classes:
+        assert determine_mro(cls) == cls.__mro__
+        assert determine_mro(*cls.__bases__) == cls.__mro__[1:]
+
+
+def test_inconsistent_hierarchy():
+    class A:
+        pass
+
+    class B(A):
+        pass
+
+    with pytest.raises(TypeError):
+        determine_mro(A, B)
@@ -0,0 +1,100 @@
+from math import copysign, isinf, isnan
+from random import Random
+from struct import pack, unpack
+
+import pytest
+
+from quantisers import FixedPointQuantiser, HalfFloatQuantiser, create_quantiser
+
+
+# Largest finite half precision value
+HALF_MAX = 65504.0
+
+
+def to_half_bits(value):
+    return unpack('<H', pack('<e', value))[0]
+
+
+def from_half_bits(bits):
+    return unpack('<e', pack('<H', bits))[0]
+
+
+def test_half_float_encode_matches_struct():
+    quantiser = HalfFloatQuantiser()
+    random = Random(0)
+
+    values = [0.0, -0.0, 1.0, -1.0, 0.5, HALF_MAX, -HALF_MAX, 2.0 ** -14, 2.0 ** -24, 2.0 ** -25, 3 * 2.0 ** -26]
+    values += [random.uniform(-HALF_MAX, HALF_MAX) for _ in range(10000)]
+    values += [random.uniform(-1.0, 1.0) for _ in range(10000)]
+    values += [random.uniform(-2.0 ** -13, 2.0 ** -13) for _ in range(10000)]
+
+    for value in values:
+        assert quantiser.encode(value) == to_half_bits(value), value
+
+
+def test_half_float_decode_matches_struct():
+    quantiser = HalfFloatQuantiser()
+
+    for bits in range(quantiser.max_value + 1):
+        expected = from_half_bits(bits)
+        value = quantiser.decode(bits)
+
+        if isnan(expected):
+            assert isnan(value), bits
+
+        else:
+            assert value == expected, bits
+            # Distinguishes signed zeros
+            assert copysign(1.0, value) == copysign(1.0, expected), bits
+
+
+def test_half_float_special_values():
+    quantiser = HalfFloatQuantiser()
+
+    assert isnan(quantiser.decode(quantiser.encode(float("nan"))))
+    assert quantiser.encode(float("inf")) == 0x7C00
+    assert quantiser.encode(float("-inf")) == 0xFC00
+    assert isinf(quantiser.decode(quantiser.encode(1e6)))
+
+
+@pytest.mark.parametrize("minimum, maximum, precision", [(0.0, 1.0, 0.01), (-100.0, 100.0, 0.1), (-3.5, 7.25, 0.3)])
+def test_fixed_point_error_bound(minimum, maximum, precision):
+    quantiser = FixedPointQuantiser(minimum, maximum, precision)
+    random = Random(0)
+
+    values = [minimum, maximum] + [random.uniform(minimum, maximum) for _ in range(10000)]
+    # Allow for rounding of the float arithmetic itself
+    tolerance = precision / 2 + 1e-9 * (maximum - minimum)
+
+    for value in values:
+        encoded = quantiser.encode(value)
+
+        assert 0 <= encoded <= quantiser.max_value
+        assert abs(quantiser.decode(encoded) - value) <= tolerance, value
+
+
+def test_fixed_point_clamps_out_of_range():
+    quantiser = FixedPointQuantiser(-1.0, 1.0, 0.01)
+
+    assert quantiser.decode(quantiser.encode(-5.0)) == -1.0
+    assert quantiser.decode(quantiser.encode(5.0)) == 1.0
+    assert quantiser.decode(quantiser.encode(float("-inf"))) == -1.0
+    assert quantiser.decode(quantiser.encode(float("inf"))) == 1.0
+
+
+def test_fixed_point_nan():
+    quantiser = FixedPointQuantiser(-1.0, 1.0, 0.01)
+
+    assert quantiser.encode(float("nan")) == 0
+    assert quantiser.decode(quantiser.encode(float("nan"))) == -1.0
+
+
+def test_create_quantiser():
+    assert create_quantiser(None) is None
+    assert isinstance(create_quantiser({'mode': "HALF"}), HalfFloatQuantiser)
+
+    quantiser = create_quantiser({'mode': "FIXED", 'minimum': 0.0, 'maximum': 2.0, 'precision': 0.5})
+    assert (quantiser.minimum, quantiser.maximum, quantiser.precision) == (0.0, 2.0, 0.5)
+
+    with pytest.raises(ValueError):
+        create_quantiser({'mode': "UNKNOWN"})
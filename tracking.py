@@ -0,0 +1,56 @@
+class SceneObjectTracker:
+    """Track objects added to and removed from a BGE scene between updates
+
+    BGE appends new objects to the end of the scene object list, so only objects after the last object seen by the
+    previous update need to be examined.
+    """
+
+    def __init__(self, bge_scene):
+        self.bge_scene = bge_scene
+
+        self._inactive_names = set()
+        self._inactive_count = -1
+
+        self._last_object = None
+        self._object_count = 0
+
+    @property
+    def inactive_names(self):
+        """Names of objects on inactive layers"""
+        objects_inactive = self.bge_scene.objectsInactive
+
+        # Inactive objects only change when libraries are loaded or freed
+        if len(objects_inactive) != self._inactive_count:
+            self._inactive_names = {o.name for o in objects_inactive}
+            self._inactive_count = len(objects_inactive)
+
+        return self._inactive_names
+
+    def update(self):
+        """Return objects added since the last update, and whether any objects were removed"""
+        objects = self.bge_scene.objects
+        object_count = len(objects)
+        last_object = self._last_object
+
+        # Fall back to full scan if we lost our place
+        if last_object is None or last_object.invalid:
+            added = list(objects)
+            has_removed = True
+
+        else:
+            added = []
+
+            for index in range(object_count - 1, -1, -1):
+                obj = objects[index]
+                if obj is last_object:
+                    break
+
+                added.append(obj)
+
+            added.reverse()
+            has_removed = object_count != self._object_count + len(added)
+
+        self._object_count = object_count
+        self._last_object = objects[object_count - 1] if object_count else None
+
+        return added, has_removed
@@ -0,0 +1,134 @@
+from collections import deque
+from select import select
+from threading import Event, Thread
+
+
+class ThreadedSocket:
+    """Non-blocking socket interface, whose reads and writes are performed by worker threads
+
+    Received packets are queued in an inbox, and packets to be sent in an outbox. Deque appends and pops are atomic,
+    so the logic thread never waits upon a lock to exchange packets with the workers.
+    """
+
+    # Maximum time (in seconds) the receiver blocks before checking if stopped
+    poll_interval = 0.01
+
+    def __init__(self, socket, buffer_size=65536):
+        """Start worker threads for socket
+
+        :param socket: non-blocking UDP socket
+        :param buffer_size: maximum size of a received packet
+        """
+        self._socket = socket
+        self.buffer_size = buffer_size
+
+        self._inbox = deque()
+        self._outbox = deque()
+
+        self._has_outgoing = Event()
+        self._stopped = Event()
+
+        self.send_errors = 0
+
+        self._receiver = Thread(target=self._receive_loop, name="NetworkReceiver", daemon=True)
+        self._sender = Thread(target=self._send_loop, name="NetworkSender", daemon=True)
+
+        self._receiver.start()
+        self._sender.start()
+
+    def __getattr__(self, name):
+        return getattr(self._socket, name)
+
+    @property
+    def pending_received(self):
+        """Number of received packets not yet read"""
+        return len(self._inbox)
+
+    @property
+    def pending_sent(self):
+        """Number of packets not yet sent"""
+        return len(self._outbox)
+
+    def recvfrom(self, buffer_size=None):
+        """Return oldest received packet and its address
+
+        Raises BlockingIOError if no packets are queued, as for a non-blocking socket
+        """
+        try:
+            return self._inbox.popleft()
+
+        except IndexError:
+            raise BlockingIOError("No packets received")
+
+    def sendto(self, data, address):
+        """Queue packet to be sent to address
+
+        :param data: packet bytes
+        :param address: address tuple
+        """
+        self._outbox.append((data, address))
+        self._has_outgoing.set()
+
+        return len(data)
+
+    def stop(self):
+        """Send queued packets and stop worker threads"""
+        if self._stopped.is_set():
+            return
+
+        self._stopped.set()
+        self._has_outgoing.set()
+
+        self._sender.join()
+        self._receiver.join()
+
+    def close(self):
+        self.stop()
+        self._socket.close()
+
+    def _receive_loop(self):
+        socket = self._socket
+        inbox = self._inbox
+        buffer_size = self.buffer_size
+        poll_interval = self.poll_interval
+        stopped = self._stopped
+
+        while not stopped.is_set():
+            try:
+                readable, _, _ = select((socket,), (), (), poll_interval)
+
+            # Socket closed
+            except (OSError, ValueError):
+                return
+
+            if not readable:
+                continue
+
+            while True:
+                try:
+                    inbox.append(socket.recvfrom(buffer_size))
+
+                except OSError:
+                    break
+
+    def _send_loop(self):
+        socket = self._socket
+        outbox = self._outbox
+        has_outgoing = self._has_outgoing
+        stopped = self._stopped
+
+        while True:
+            has_outgoing.wait()
+            has_outgoing.clear()
+
+            while outbox:
+                data, address = outbox.popleft()
+
+                try:
+                    socket.sendto(data, address)
+
+                except OSError:
+                    self.send_errors += 1
+
+            if stopped.is_set():
+                return
@@ -1,5 +1,9 @@
 from contextlib import contextmanager
-from inspect import isclass
+from importlib import reload
+from importlib.util import find_spec
+from inspect import isclass, getmembers
+from os.path import getmtime
+from time import perf_counter
 import sys
 
 from network.replicable import Replicable
@@ -7,6 +11,12 @@ from network.replicable import Replicable
 busy_operations = set()
 template_modules = {}
 
+# Template introspection results, keyed by import path and module modification time
+template_defaults_cache = {}
+template_module_cache = {}
+
+UI_TYPES = int, bool, str, float
+
 
 @contextmanager
 def if_not_busy(identifier):
@@ -20,6 +30,61 @@ def if_not_busy(identifier):
         busy_operations.remove(identifier)
 
 
+class ConditionalHandler:
+    """Handler which only runs its callback when a fingerprint of its dependencies changes
+
+    The fingerprint is recorded after the callback runs, so that changes made by the callback do not cause it to run
+    again.
+    """
+
+    def __init__(self, callback, get_fingerprint, min_interval=0.0):
+        """Wrap handler callback
+
+        :param callback: callable taking context
+        :param get_fingerprint: callable taking context, returning hashable summary of dependencies
+        :param min_interval: minimum time (in seconds) between checks for changes
+        """
+        self.callback = callback
+        self.get_fingerprint = get_fingerprint
+        self.min_interval = min_interval
+
+        self.run_count = 0
+        self.skip_count = 0
+
+        self._fingerprint = None
+        self._has_run = False
+        self._last_checked = None
+
+    def __call__(self, context):
+        if self.min_interval:
+            now = perf_counter()
+
+            if self._last_checked is not None and now - self._last_checked < self.min_interval:
+                self.skip_count += 1
+                return
+
+            self._last_checked = now
+
+        if self._has_run and self.get_fingerprint(context) == self._fingerprint:
+            self.skip_count += 1
+            return
+
+        self.callback(context)
+
+        self._fingerprint = self.get_fingerprint(context)
+        self._has_run = True
+        self.run_count += 1
+
+    def invalidate(self):
+        """Force callback to run on next update"""
+        self._has_run = False
+
+    def reset_counts(self):
+        """Reset numbers of runs and skipped updates"""
+        self.run_count = 0
+        self.skip_count = 0
+
+
 class TemplateClassReference:
 
     def __init__(self, path):
@@ -28,6 +93,7 @@ class TemplateClassReference:
         self._path = path
         self._cls = None
         self._modules = None
+        self._last_modified = None
 
     @property
     def references(self):
@@ -45,6 +111,20 @@ class TemplateClassReference:
 
         self._cls = cls
         self._modules = loaded_modules
+        self._last_modified = get_module_last_modified(cls.__module__)
+
+    def refresh(self):
+        """Re-import class if its module source has changed since it was loaded"""
+        if not self._references:
+            return
+
+        module_path = self._cls.__module__
+        if get_module_last_modified(module_path) == self._last_modified:
+            return
+
+        self._free_modules()
+        sys.modules.pop(module_path, None)
+        self._load_modules()
 
     def get_reference(self):
         if not self._references:
@@ -71,6 +151,90 @@ def load_template(path):
     return info.get_reference()
 
 
+def get_module_last_modified(module_path):
+    """Return modification time of module source file, or None if it cannot be found
+
+    :param module_path: import path of module
+    """
+    module = sys.modules.get(module_path)
+
+    if module is not None:
+        file_path = getattr(module, "__file__", None)
+
+    else:
+        try:
+            spec = find_spec(module_path)
+
+        except (ImportError, AttributeError, ValueError):
+            return None
+
+        file_path = spec.origin if spec is not None else None
+
+    if not file_path:
+        return None
+
+    try:
+        return getmtime(file_path)
+
+    except OSError:
+        return None
+
+
+def load_template_module(module_path):
+    """Import template module, re-importing it only if its source has changed
+
+    :param module_path: import path of module
+    """
+    last_modified = get_module_last_modified(module_path)
+
+    try:
+        cached_last_modified, module = template_module_cache[module_path]
+
+    except KeyError:
+        module = __import__(module_path, fromlist=[''])
+
+    else:
+        if sys.modules.get(module_path) is not module:
+            module = __import__(module_path, fromlist=[''])
+
+        elif cached_last_modified != last_modified:
+            module = reload(module)
+
+    template_module_cache[module_path] = last_modified, module
+    return module
+
+
+def get_template_defaults(template_path):
+    """Return UI-typed default attribute values of template class, as (name, type, value) tuples
+
+    Takes a reference to the template class, which must be released with unload_template
+
+    :param template_path: import path of template class
+    """
+    try:
+        template_modules[template_path].refresh()
+
+    except KeyError:
+        pass
+
+    cls = load_template(template_path)
+
+    module_path = template_path.rpartition(".")[0]
+    key = template_path, get_module_last_modified(module_path)
+
+    try:
+        return template_defaults_cache[key]
+
+    except KeyError:
+        pass
+
+    defaults = tuple((name, type_to_enum_type(type(value)), value) for name, value in getmembers(cls)
+                     if not name.startswith("_") and type(value) in UI_TYPES)
+
+    template_defaults_cache[key] = defaults
+    return defaults
+
+
 def unload_template(path):
     try:
         info = template_modules[path]
@@ -110,43 +274,6 @@ def get_active_item(collection, index):
     return collection[index]
 
 
-def determine_mro(*bases):
-    """Calculate the Method Resolution Order of bases using the C3 algorithm.
-
-    Suppose you intended creating a class K with the given base classes. This
-    function returns the MRO which K would have, *excluding* K itself (since
-    it doesn't yet exist), as if you had actually created the class.
-
-    Another way of looking at this, if you pass a single class K, this will
-    return the linearization of K (the MRO of K, *including* itself).
-    """
-    seqs = [list(C.__mro__) for C in bases] + [list(bases)]
-    res = []
-    while True:
-        non_empty = list(filter(None, seqs))
-        if not non_empty:
-            # Nothing left to process, we're done.
-            return tuple(res)
-
-        for seq in non_empty:  # Find merge candidates among seq heads.
-            candidate = seq[0]
-            not_head = [s for s in non_empty if candidate in s[1:]]
-            if not_head:
-                # Reject the candidate.
-                candidate = None
-            else:
-                break
-
-        if not candidate:
-            raise TypeError("inconsistent hierarchy, no C3 MRO is possible")
-
-        res.append(candidate)
-        for seq in non_empty:
-            # Remove candidate.
-            if seq[0] == candidate:
-                del seq[0]
-
-
 def get_bpy_enum(enum):
     enum_name = enum.__name__.rstrip("s").lower()
     e = [(x.upper(), x.replace('_', ' ').title(), "{} {}".format(x.capitalize(), enum_name), 'BLANK1', v)